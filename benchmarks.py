@@ -0,0 +1,368 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from itertools import combinations
+from codebook import (load_basis, pack_vectors, generate_codewords, popcount,
+                      weight_distribution, permute_words, same_code)
+from gf2 import pack_rows
+from greedy_engine import GreedySearch, ParallelGreedySearch
+from min_distance import minimum_distance
+from puncture_analysis import puncture_table
+from equivalence import find_equivalence
+from syndrome_decoder import SyndromeDecoder
+from soft_decoder import SoftDecoder, bpsk_llrs
+from table_encoder import TableEncoder
+
+# Each benchmark runs a reference implementation (the plain algorithm the
+# scripts started from) and the fast engines on the same fixed input from
+# the shipped basis files.  Every result is normalized and compared with
+# the reference's; any mismatch makes the suite fail.
+
+SELF_DUAL = 'golay_self_dual_basis.txt'
+PERFECT = 'golay_perfect_23_basis.txt'
+GREEDY_23 = 'golay_23bit_basis.txt'
+
+# --- Reference implementations ---------------------------------------------
+
+def reference_codewords(basis):
+    """XOR the basis rows selected by each message, one message at a time."""
+    k, n = basis.shape
+    codewords = np.zeros((1 << k, n), dtype=int)
+    for m in range(1 << k):
+        for j in range(k):
+            if (m >> j) & 1:
+                codewords[m] ^= basis[j]
+    return codewords
+
+def reference_weight_distribution(codewords, n):
+    weights = [int(np.sum(cw)) for cw in codewords]
+    distribution = np.bincount(weights, minlength=n + 1)
+    return distribution, min(w for w in weights if w)
+
+def reference_greedy(n, d, k, weights, seed=(), self_orthogonal=False, chunk_size=1024):
+    """Regenerate the codebook after each step; test candidates against every codeword.
+
+    With self_orthogonal, candidates must also have even weight and an
+    even overlap with every basis vector so far.
+    """
+    basis = list(seed)
+    while len(basis) < k:
+        codewords = generate_codewords(np.array(basis, dtype=np.uint32))
+        word = None
+        for weight in weights:
+            positions = list(combinations(range(n), weight))
+            for start in range(0, len(positions), chunk_size):
+                candidates = np.array([sum(1 << p for p in s)
+                                       for s in positions[start:start + chunk_size]],
+                                      dtype=np.uint32)
+                distances = popcount(candidates[:, None] ^ codewords[None, :]).min(axis=1)
+                keep = distances >= d
+                if self_orthogonal:
+                    overlaps = popcount(candidates[:, None] & np.array(basis + [0], dtype=np.uint32))
+                    keep &= ((overlaps & 1) == 0).all(axis=1) & ((popcount(candidates) & 1) == 0)
+                hits = np.flatnonzero(keep)
+                if len(hits):
+                    word = int(candidates[hits[0]])
+                    break
+            if word is not None:
+                break
+        if word is None:
+            break
+        basis.append(word)
+    return basis
+
+def reference_puncture(basis):
+    """Puncture each position in turn: regenerate, deduplicate and rescan."""
+    n = basis.shape[1]
+    table = []
+    for pos in range(n):
+        words = generate_codewords(pack_vectors(np.delete(basis, pos, axis=1)))
+        unique = np.unique(words)
+        weights = popcount(unique[unique != 0])
+        table.append((len(unique), int(weights.min()) if len(weights) else 0))
+    return table
+
+def reference_encode(generator_matrix, messages):
+    """data @ G mod 2 for each message, one message at a time."""
+    k = generator_matrix.shape[0]
+    codewords = []
+    for m in messages:
+        data = np.array([(int(m) >> j) & 1 for j in range(k)], dtype=int)
+        codewords.append((data @ generator_matrix) % 2)
+    return np.array(codewords)
+
+def reference_decode(codewords, received):
+    """Nearest codeword by comparing against the whole codebook."""
+    distances = popcount(received[:, None] ^ codewords[None, :])
+    return codewords[distances.argmin(axis=1)]
+
+def reference_soft_decode(codewords, n, llrs):
+    """Correlate each row of LLRs with every ±1 codeword, one row at a time."""
+    signs = 1 - 2 * ((codewords[:, None] >> np.arange(n, dtype=np.uint32)) & 1).astype(np.float32)
+    return np.array([codewords[np.argmax(signs @ row)] for row in llrs])
+
+# --- Benchmarks -------------------------------------------------------------
+
+def _codebook_benchmark():
+    basis = load_basis(SELF_DUAL)
+    words = pack_vectors(basis)
+    return {
+        "name": "codebook",
+        "input": f"{SELF_DUAL} (2^{len(basis)} codewords)",
+        "implementations": [
+            ("reference", lambda: reference_codewords(basis),
+             lambda cw: np.sort(pack_vectors(cw))),
+            ("generate_codewords[message]", lambda: generate_codewords(words),
+             np.sort),
+            ("generate_codewords[gray]", lambda: generate_codewords(words, order="gray"),
+             np.sort),
+        ],
+    }
+
+def _weight_distribution_benchmark():
+    basis = load_basis(SELF_DUAL)
+    n = basis.shape[1]
+    vectors = reference_codewords(basis)
+    words = generate_codewords(pack_vectors(basis))
+    normalize = lambda result: (result[0].tolist(), int(result[1]))
+    return {
+        "name": "weight_distribution",
+        "input": SELF_DUAL,
+        "implementations": [
+            ("reference", lambda: reference_weight_distribution(vectors, n), normalize),
+            ("weight_distribution", lambda: weight_distribution(words, n), normalize),
+        ],
+    }
+
+def _min_distance_benchmark():
+    basis = load_basis(PERFECT)
+    n = basis.shape[1]
+    rows = pack_rows(basis)
+    words = pack_vectors(basis)
+    return {
+        "name": "min_distance",
+        "input": PERFECT,
+        "implementations": [
+            ("reference", lambda: reference_weight_distribution(reference_codewords(basis), n)[1],
+             int),
+            ("weight_distribution", lambda: weight_distribution(generate_codewords(words), n)[1],
+             int),
+            ("brouwer_zimmermann", lambda: minimum_distance(rows, n)["min_distance"], int),
+        ],
+    }
+
+def _parallel_greedy(n, d, k, weights, seed, constraint, workers):
+    with ParallelGreedySearch(n, d, workers) as search:
+        return search.run(k, weights, seed, constraint)
+
+def _greedy_benchmark(name, n, k, d, weights, seed, constraint="none"):
+    """Benchmark one of the greedy_*.py searches (same parameters as the script)."""
+    self_orthogonal = constraint == "self-orthogonal"
+    label = f"[{n},{k},{d}]" if constraint == "none" else f"{constraint} [{n},{k},{d}]"
+    return {
+        "name": name,
+        "input": f"{label} seeded with {seed[0]:#x}, weights {weights}",
+        "implementations": [
+            ("reference", lambda: reference_greedy(n, d, k, weights, seed, self_orthogonal), list),
+            ("GreedySearch", lambda: GreedySearch(n, d).run(k, weights, seed, constraint), list),
+            ("ParallelGreedySearch[2]",
+             lambda: _parallel_greedy(n, d, k, weights, seed, constraint, 2), list),
+        ],
+    }
+
+def _puncture_benchmark():
+    basis = load_basis(SELF_DUAL)
+    n = basis.shape[1]
+    words = pack_vectors(basis)
+
+    def fast():
+        table = puncture_table(generate_codewords(words), n)
+        return [(1 << int(k), int(d)) for k, d in zip(table["punctured_k"], table["punctured_d"])]
+
+    return {
+        "name": "puncture_sweep",
+        "input": f"{SELF_DUAL}, all {n} positions",
+        "implementations": [
+            ("reference", lambda: reference_puncture(basis), list),
+            ("puncture_table", fast, list),
+        ],
+    }
+
+def _encode_benchmark(count=4096):
+    basis = load_basis(SELF_DUAL)
+    n = basis.shape[1]
+    words = pack_vectors(basis)
+    messages = np.random.default_rng(0).integers(0, 1 << len(words), count, dtype=np.uint32)
+    full = TableEncoder(words, n)
+    split = TableEncoder(words, n, chunk_bits=6)
+    return {
+        "name": "encode",
+        "input": f"{SELF_DUAL}, {count} random messages",
+        "implementations": [
+            ("reference", lambda: reference_encode(basis, messages), pack_vectors),
+            ("TableEncoder[4096]", lambda: full.encode(messages), np.asarray),
+            ("TableEncoder[64x2]", lambda: split.encode(messages), np.asarray),
+        ],
+    }
+
+def _decode_benchmark(count=2000):
+    basis = load_basis(PERFECT)
+    n = basis.shape[1]
+    words = pack_vectors(basis)
+    codewords = generate_codewords(words)
+    rng = np.random.default_rng(0)
+    received = codewords[rng.integers(0, len(codewords), count)]
+    for _ in range(3):
+        received ^= np.uint32(1) << rng.integers(0, n, count).astype(np.uint32)
+    decoder = SyndromeDecoder(words, n)
+    return {
+        "name": "decode",
+        "input": f"{PERFECT}, {count} words with 3 random bit flips",
+        "implementations": [
+            ("reference", lambda: reference_decode(codewords, received), np.asarray),
+            ("SyndromeDecoder", lambda: decoder.decode(received)[0], np.asarray),
+        ],
+    }
+
+def _soft_decode_benchmark(count=2000):
+    basis = load_basis(SELF_DUAL)
+    n = basis.shape[1]
+    words = pack_vectors(basis)
+    codewords = generate_codewords(words)
+    rng = np.random.default_rng(0)
+    llrs = bpsk_llrs(codewords[rng.integers(0, len(codewords), count)], n, 2.0, 0.5, rng)
+    decoder = SoftDecoder(words, n)
+    return {
+        "name": "soft_decode",
+        "input": f"{SELF_DUAL}, {count} BPSK/AWGN blocks at Eb/N0 = 2 dB",
+        "implementations": [
+            ("reference", lambda: reference_soft_decode(codewords, n, llrs), np.asarray),
+            ("SoftDecoder", lambda: decoder.decode(llrs)[0], np.asarray),
+        ],
+    }
+
+def _equivalence_benchmark():
+    basis_a = pack_vectors(load_basis(PERFECT))
+    basis_b = pack_vectors(load_basis(GREEDY_23))
+    codewords_a = generate_codewords(basis_a)
+    codewords_b = np.sort(generate_codewords(basis_b))
+    # No feasible reference search exists, so the answer is checked directly
+    return {
+        "name": "permutation_search",
+        "input": f"{PERFECT} -> {GREEDY_23}",
+        "implementations": [
+            ("find_equivalence", lambda: find_equivalence(basis_a, basis_b, 23),
+             lambda perm: perm is not None
+             and same_code(codewords_b, permute_words(codewords_a, perm))),
+        ],
+        "expected": True,
+    }
+
+# (name, spec factory): specs load their inputs when built, so only the
+# benchmarks selected with --only are built
+BENCHMARKS = [
+    ("codebook", _codebook_benchmark),
+    ("weight_distribution", _weight_distribution_benchmark),
+    ("min_distance", _min_distance_benchmark),
+    ("greedy_search", lambda: _greedy_benchmark(
+        "greedy_search", 24, 12, 8, [8, 12, 16, 20], [0xffffff])),
+    ("greedy_self_dual", lambda: _greedy_benchmark(
+        "greedy_self_dual", 24, 12, 8, [8, 12, 16, 20], [0xffffff], "self-orthogonal")),
+    ("greedy_23bit", lambda: _greedy_benchmark(
+        "greedy_23bit", 23, 12, 7, [7, 11, 15, 19], [0x7f])),
+    ("puncture_sweep", _puncture_benchmark),
+    ("encode", _encode_benchmark),
+    ("decode", _decode_benchmark),
+    ("soft_decode", _soft_decode_benchmark),
+    ("permutation_search", _equivalence_benchmark),
+]
+
+# --- Runner -----------------------------------------------------------------
+
+def _same(a, b):
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+def measure(function, min_time=0.5, max_runs=1000):
+    """Run function until min_time has passed; returns (result, runs, seconds, peak bytes)."""
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    runs = 0
+    start_time = time.perf_counter()
+    elapsed = 0.0
+    while runs < max_runs and (runs == 0 or elapsed < min_time):
+        function()
+        runs += 1
+        elapsed = time.perf_counter() - start_time
+    return result, runs, elapsed, peak
+
+def run_benchmark(spec, min_time=0.5):
+    """Time every implementation of one benchmark and compare the results."""
+    expected = spec.get("expected")
+    report = {"name": spec["name"], "input": spec["input"], "implementations": []}
+    for name, function, normalize in spec["implementations"]:
+        result, runs, elapsed, peak = measure(function, min_time)
+        answer = normalize(result)
+        if expected is None:
+            expected = answer
+        report["implementations"].append({
+            "name": name,
+            "runs": runs,
+            "seconds_per_op": elapsed / runs,
+            "ops_per_sec": runs / elapsed,
+            "peak_memory_bytes": peak,
+            "matches_reference": bool(_same(answer, expected)),
+        })
+    report["ok"] = all(impl["matches_reference"] for impl in report["implementations"])
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the reference and fast code engines.")
+    parser.add_argument("--output", default="-",
+                        help="JSON results file (default: stdout)")
+    parser.add_argument("--only", nargs="*", default=None,
+                        help="run only the named benchmarks")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="seconds to spend timing each implementation (default: 0.5)")
+    args = parser.parse_args(argv)
+    names = [name for name, _ in BENCHMARKS]
+    unknown = sorted(set(args.only or []) - set(names))
+    if unknown:
+        parser.error(f"unknown benchmarks {unknown}; choose from {names}")
+
+    reports = []
+    for name, make_spec in BENCHMARKS:
+        if args.only is not None and name not in args.only:
+            continue
+        report = run_benchmark(make_spec(), args.min_time)
+        reports.append(report)
+        for impl in report["implementations"]:
+            status = "✓" if impl["matches_reference"] else "✗ MISMATCH"
+            print(f"{status} {report['name']:20s} {impl['name']:28s} "
+                  f"{impl['ops_per_sec']:12.2f} ops/s "
+                  f"{impl['peak_memory_bytes'] / 1e6:9.2f} MB peak", file=sys.stderr)
+
+    results = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "benchmarks": reports,
+        "ok": all(report["ok"] for report in reports),
+    }
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0 if results["ok"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
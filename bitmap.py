@@ -0,0 +1,62 @@
+import numpy as np
+from codebook import popcount
+
+# SWAP_MASKS[s] selects the lower half of every 2^(s+1)-bit block of a word
+SWAP_MASKS = [
+    np.uint64(0x5555555555555555),
+    np.uint64(0x3333333333333333),
+    np.uint64(0x0F0F0F0F0F0F0F0F),
+    np.uint64(0x00FF00FF00FF00FF),
+    np.uint64(0x0000FFFF0000FFFF),
+    np.uint64(0x00000000FFFFFFFF),
+]
+
+def empty_bitmap(n):
+    """All-zero bitmap with one bit for each of the 2^n length-n vectors."""
+    return np.zeros(max(1, (1 << n) >> 6), dtype=np.uint64)
+
+def ball_bitmap(n, radius, chunk_bits=20):
+    """Bitmap of every length-n vector of weight <= radius."""
+    bitmap = empty_bitmap(n)
+    chunk = 1 << min(n, chunk_bits)
+    for start in range(0, 1 << n, chunk):
+        vectors = np.arange(start, start + chunk, dtype=np.uint32)
+        set_bits(bitmap, vectors[popcount(vectors) <= radius])
+    return bitmap
+
+def set_bits(bitmap, indices):
+    """Set the bits at the given vector indices (in place)."""
+    indices = np.asarray(indices, dtype=np.uint64)
+    np.bitwise_or.at(bitmap, indices >> np.uint64(6),
+                     np.uint64(1) << (indices & np.uint64(63)))
+
+def test_bits(bitmap, indices):
+    """Boolean array telling which vector indices are set in the bitmap."""
+    indices = np.asarray(indices, dtype=np.uint64)
+    words = bitmap[indices >> np.uint64(6)]
+    return ((words >> (indices & np.uint64(63))) & np.uint64(1)).astype(bool)
+
+def count_bits(bitmap):
+    """Number of set bits in the bitmap."""
+    return int(popcount(bitmap.view(np.uint32)).sum(dtype=np.int64))
+
+def xor_translate(bitmap, v):
+    """Bitmap of the translate {x ^ v : x in bitmap}.
+
+    The high bits of v permute whole words; the low six bits permute bits
+    inside each word, one butterfly swap per set bit.
+    """
+    v = int(v)
+    translated = bitmap[np.arange(len(bitmap)) ^ (v >> 6)]
+    for s, mask in enumerate(SWAP_MASKS):
+        if (v >> s) & 1:
+            shift = np.uint64(1 << s)
+            translated = ((translated >> shift) & mask) | ((translated & mask) << shift)
+    return translated
+
+def dilate(bitmap, n):
+    """Bitmap of every vector within distance 1 of a vector in the bitmap."""
+    dilated = bitmap.copy()
+    for i in range(n):
+        dilated |= xor_translate(bitmap, 1 << i)
+    return dilated
@@ -1,36 +1,35 @@
 import numpy as np
+from gf2 import from_ints, gram, rank
+from code_cache import load_code
+from weight_enumerator import macwilliams
 
 print("=" * 70)
 print("CHECKING IF OUR [24,12,8] CODE IS SELF-DUAL")
 print("=" * 70)
 
-# Load the 24-bit basis
-basis_24 = []
-with open('golay_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_24.append(vec)
+# Load the 24-bit basis once; the packed rows and weight distribution below both come from it
+code = load_code('golay_basis.txt')
 
-print(f"\n✓ Loaded {len(basis_24)} basis vectors")
+print(f"\n✓ Loaded {code.k} basis vectors")
 
 # Create generator matrix G (12 x 24)
-G = np.array(basis_24, dtype=int)
-print(f"✓ Generator matrix G shape: {G.shape}")
+G = from_ints(code.basis, code.n)
+n = code.n
+print(f"✓ Generator matrix G shape: {(code.k, n)}")
+print(f"✓ Rank over GF(2): {rank(G, n)}")
 
 print("\n" + "=" * 70)
 print("Self-Dual Test: G @ G^T = 0 (mod 2)?")
 print("=" * 70)
 
-# Compute G @ G^T mod 2
-GT = G.T
-product = (G @ GT) % 2
+# Compute G @ G^T mod 2 from the packed rows
+product = gram(G)
 
 print("\nG @ G^T (mod 2):")
 print(product)
 
-# Check if it's all zeros
-is_self_dual = np.all(product == 0)
+# Self-orthogonal (all zeros) with k = n/2 means C = C⊥
+is_self_dual = not product.any() and 2 * rank(G, n) == n
 
 print("\n" + "=" * 70)
 if is_self_dual:
@@ -50,6 +49,19 @@ else:
     print("distribution but is NOT equivalent to the standard extended")
     print("Golay code (which is self-dual).")
 
+print("\n" + "=" * 70)
+print("DUAL CODE WEIGHT DISTRIBUTION (MacWilliams identity)")
+print("=" * 70)
+
+# A self-dual code must have the same distribution as its dual
+distribution = [int(a) for a in code.weight_distribution]
+dual_distribution = macwilliams(distribution, n)
+print("\n  Weight    Code    Dual")
+for w in range(n + 1):
+    if distribution[w] or dual_distribution[w]:
+        print(f"  {w:6d} {distribution[w]:7d} {dual_distribution[w]:7d}")
+print(f"\n  Same distribution as the dual? {distribution == dual_distribution}")
+
 print("\n" + "=" * 70)
 print("DETAILED ANALYSIS")
 print("=" * 70)
@@ -0,0 +1,71 @@
+import json
+import os
+import time
+
+# Greedy search checkpoints are small JSON files holding the run's
+# parameters (n, d, constraint and candidate weights), the accepted
+# basis and how far the scan for the next basis vector has got: the
+# weight list being scanned, the current weight class, the next
+# combination rank to test and the candidates already counted in
+# earlier weight classes.  Files are replaced atomically, so a run
+# killed mid-write leaves the previous checkpoint intact.  A file is
+# only loaded back when its parameters match the current run's.
+
+DEFAULT_INTERVAL = 60.0
+
+class Checkpoint:
+    """Atomic JSON checkpoint file, with saves throttled to one per interval.
+
+    Every save also records `parameters`, and load() refuses a file saved
+    with different ones.
+    """
+
+    def __init__(self, path, interval=DEFAULT_INTERVAL, parameters=None):
+        self.path = path
+        self.interval = interval
+        self.parameters = dict(parameters or {})
+        self._last_save = time.time()
+
+    def save(self, state):
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({**state, **self.parameters}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._last_save = time.time()
+
+    def maybe_save(self, state_function):
+        """Save state_function() if the interval has passed since the last save."""
+        if time.time() - self._last_save >= self.interval:
+            self.save(state_function())
+
+    def load(self):
+        """The saved state; raises ValueError if it is missing, unreadable or for other parameters."""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(f"No checkpoint file {self.path}")
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read checkpoint {self.path}: {e}")
+        if not isinstance(state, dict):
+            raise ValueError(f"Checkpoint {self.path} is not a checkpoint object")
+        for name, value in self.parameters.items():
+            if state.get(name) != value:
+                raise ValueError(f"Checkpoint {self.path} has {name}={state.get(name)!r}, "
+                                 f"but this run has {name}={value!r}")
+        return state
+
+def add_arguments(parser, default_path):
+    """Add --checkpoint, --checkpoint-interval and --resume to an argparse parser."""
+    parser.add_argument("--checkpoint", metavar="PATH", default=default_path,
+                        help=f"checkpoint file (default: {default_path})")
+    parser.add_argument("--checkpoint-interval", type=float, default=DEFAULT_INTERVAL,
+                        metavar="SECONDS",
+                        help=f"seconds between mid-scan checkpoints (default: {DEFAULT_INTERVAL:g})")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue from the checkpoint file instead of starting over")
+
+def from_args(args, parameters=None):
+    return Checkpoint(args.checkpoint, args.checkpoint_interval, parameters)
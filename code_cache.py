@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import numpy as np
+from codebook import load_basis, pack_vectors, generate_codewords, weight_distribution
+from syndrome_decoder import SyndromeDecoder
+from table_encoder import TableEncoder, FULL_TABLE_BITS
+
+# Binary codebook cache.  Each basis file maps to a directory named by the
+# SHA-256 of its text, holding the packed basis rows plus any artifacts
+# computed so far, each as a .npy file that is memory-mapped on load.
+# Editing the text basis changes the hash, so stale entries are never read.
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.golay_cache')
+
+def cache_key(basis_file):
+    """SHA-256 of a basis file's contents."""
+    with open(basis_file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def _save_atomic(path, array):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+class CachedCode:
+    """A code loaded from a basis file through the binary cache.
+
+    The packed basis is always present; the codeword table (message
+    order), weight distribution and syndrome tables are computed on first
+    use and written back to the cache for later runs.
+    """
+
+    def __init__(self, basis_file, cache_dir=CACHE_DIR):
+        self.basis_file = basis_file
+        self.key = cache_key(basis_file)
+        self.directory = os.path.join(cache_dir, self.key)
+        meta_path = os.path.join(self.directory, 'code.json')
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                self.n = json.load(f)["n"]
+            self.basis = self._load('basis')
+        else:
+            basis = load_basis(basis_file)
+            self.n = basis.shape[1]
+            os.makedirs(self.directory, exist_ok=True)
+            self.basis = self._store('basis', pack_vectors(basis))
+            tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({"source": os.path.basename(basis_file), "n": self.n,
+                           "k": len(self.basis)}, f)
+            os.replace(tmp_path, meta_path)
+        self.k = len(self.basis)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.npy")
+
+    def _load(self, name):
+        return np.load(self._path(name), mmap_mode='r')
+
+    def _store(self, name, array):
+        _save_atomic(self._path(name), array)
+        return self._load(name)
+
+    def _artifact(self, name, compute):
+        if not os.path.exists(self._path(name)):
+            return self._store(name, compute())
+        return self._load(name)
+
+    @property
+    def codewords(self):
+        """All 2^k packed codewords, codeword m at index m."""
+        return self._artifact('codewords', lambda: generate_codewords(self.basis))
+
+    @property
+    def weight_distribution(self):
+        return self._artifact('weights', lambda: weight_distribution(self.codewords, self.n)[0])
+
+    @property
+    def min_distance(self):
+        nonzero = np.flatnonzero(self.weight_distribution[1:])
+        return int(nonzero[0]) + 1 if len(nonzero) else 0
+
+    def decoder(self):
+        """SyndromeDecoder for the code, reusing the cached distance and coset-leader tables."""
+        if os.path.exists(self._path('error_table')) and os.path.exists(self._path('error_weights')):
+            return SyndromeDecoder(self.basis, self.n,
+                                   error_table=self._load('error_table'),
+                                   error_weights=self._load('error_weights'),
+                                   d=self.min_distance)
+        decoder = SyndromeDecoder(self.basis, self.n, d=self.min_distance)
+        self._store('error_table', decoder.error_table)
+        self._store('error_weights', decoder.error_weights)
+        return decoder
+
+    def encoder(self):
+        """TableEncoder for the code, gathering from the cached codeword table when it fits."""
+        if self.k <= FULL_TABLE_BITS:
+            return TableEncoder(self.basis, self.n, table=self.codewords)
+        return TableEncoder(self.basis, self.n)
+
+def load_code(basis_file, cache_dir=CACHE_DIR):
+    """Load a basis file through the binary cache."""
+    return CachedCode(basis_file, cache_dir)
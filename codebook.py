@@ -0,0 +1,155 @@
+import numpy as np
+
+MAX_PACKED_LENGTH = 32
+
+def load_basis(filename):
+    """Load a basis file: one space-separated binary vector per line, # comments."""
+    basis = []
+    with open(filename, 'r') as f:
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                basis.append([int(x) for x in line.split()])
+    return np.array(basis, dtype=int)
+
+def save_basis(filename, vectors, title):
+    """Write a basis file that load_basis reads back: a title comment, then one row per vector."""
+    with open(filename, 'w') as f:
+        f.write(f"# {title}\n")
+        f.write("# Each row is a basis vector\n\n")
+        for vec in vectors:
+            f.write(' '.join(map(str, vec)) + '\n')
+
+def pack_vectors(vectors):
+    """Pack binary vectors into uint32 words (coordinate i -> bit i)."""
+    vectors = np.asarray(vectors, dtype=np.uint64)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    n = vectors.shape[1]
+    if n > MAX_PACKED_LENGTH:
+        raise ValueError(f"Cannot pack length-{n} vectors into uint32 words")
+    place_values = np.uint64(1) << np.arange(n, dtype=np.uint64)
+    return (vectors @ place_values).astype(np.uint32)
+
+def unpack_words(words, n):
+    """Unpack uint32 words into an array of binary vectors of length n."""
+    words = np.asarray(words, dtype=np.uint32)
+    shifts = np.arange(n, dtype=np.uint32)
+    return ((words[..., None] >> shifts) & 1).astype(int)
+
+def generate_codewords(basis_words, order="message"):
+    """Enumerate all 2^k codewords spanned by packed basis words.
+
+    The codebook is built one basis row at a time: the block of codewords
+    that use row j is the block that does not, XORed with row j, so every
+    codeword costs exactly one XOR.
+
+    order="message" puts the codeword for message m at index m (bit j of m
+    selects basis row j).  order="gray" walks the reflected Gray code, so
+    consecutive codewords differ by exactly one basis row.
+    """
+    basis_words = np.asarray(basis_words, dtype=np.uint32).ravel()
+    k = len(basis_words)
+    codewords = np.zeros(1 << k, dtype=np.uint32)
+
+    for j, row in enumerate(basis_words):
+        half = 1 << j
+        if order == "gray":
+            block = codewords[half - 1::-1]
+        elif order == "message":
+            block = codewords[:half]
+        else:
+            raise ValueError(f"Unknown codeword order: {order!r}")
+        np.bitwise_xor(block, row, out=codewords[half:2 * half])
+
+    return codewords
+
+def generate_all_linear_combinations(basis_vectors):
+    """Generate all 2^k linear combinations of k basis vectors.
+
+    Returns a (2^k, n) array of binary vectors, row m being the combination
+    selected by the bits of m.
+    """
+    n = len(basis_vectors[0])
+    return unpack_words(generate_codewords(pack_vectors(basis_vectors)), n)
+
+_WORD_WEIGHTS = np.array([bin(i).count("1") for i in range(1 << 16)], dtype=np.uint8)
+
+def popcount(words):
+    """Hamming weight of every packed uint32 word, via a 16-bit lookup table."""
+    words = np.asarray(words, dtype=np.uint32)
+    return _WORD_WEIGHTS[words & 0xFFFF] + _WORD_WEIGHTS[words >> 16]
+
+def weight_distribution(words, n):
+    """Weight histogram and minimum nonzero weight of packed codewords.
+
+    Returns (distribution, min_distance) where distribution[w] counts the
+    codewords of weight w for w = 0..n.  For a linear code the minimum
+    nonzero weight is the minimum distance; it is 0 if every word is zero.
+    """
+    distribution = np.bincount(popcount(words), minlength=n + 1)
+    nonzero = np.flatnonzero(distribution[1:])
+    min_distance = int(nonzero[0]) + 1 if len(nonzero) else 0
+    return distribution, min_distance
+
+def linear_map_tables(images, chunk_bits=8):
+    """Lookup tables for the GF(2)-linear map sending unit vector e_i to images[i].
+
+    The input bits are split into chunks of chunk_bits; table c holds the
+    image of every possible value of chunk c.
+    """
+    images = np.asarray(images, dtype=np.uint32).ravel()
+    tables = []
+    for start in range(0, len(images), chunk_bits):
+        chunk = images[start:start + chunk_bits]
+        table = np.zeros(1 << chunk_bits, dtype=np.uint32)
+        table[:1 << len(chunk)] = generate_codewords(chunk)
+        tables.append(table)
+    return np.array(tables)
+
+def apply_linear_map(tables, words):
+    """Apply a map built by linear_map_tables to packed words, one gather per chunk."""
+    words = np.asarray(words, dtype=np.uint32)
+    chunk_bits = tables.shape[1].bit_length() - 1
+    mask = np.uint32(tables.shape[1] - 1)
+    result = tables[0][words & mask]
+    for c in range(1, len(tables)):
+        result ^= tables[c][(words >> np.uint32(c * chunk_bits)) & mask]
+    return result
+
+def permute_words(words, perm):
+    """Move bit i of every packed word to bit perm[i]."""
+    words = np.asarray(words, dtype=np.uint32)
+    permuted = np.zeros_like(words)
+    for i, j in enumerate(perm):
+        permuted |= ((words >> np.uint32(i)) & np.uint32(1)) << np.uint32(j)
+    return permuted
+
+def _sorted_unique(words):
+    """Sorted copy of packed words, deduplicated only if it has to be."""
+    words = np.sort(np.asarray(words, dtype=np.uint32))
+    if len(words) > 1 and np.any(words[1:] == words[:-1]):
+        words = np.unique(words)
+    return words
+
+def compare_codes(words_a, words_b):
+    """Compare two sets of packed codewords without building Python objects.
+
+    Returns a dict with the number of distinct codewords in each code, the
+    number they share, the numbers found in only one of them, and whether
+    the two sets are identical.
+    """
+    a = _sorted_unique(words_a)
+    b = _sorted_unique(words_b)
+    common = len(np.intersect1d(a, b, assume_unique=True))
+    return {
+        "identical": np.array_equal(a, b),
+        "size_a": len(a),
+        "size_b": len(b),
+        "common": common,
+        "only_a": len(a) - common,
+        "only_b": len(b) - common,
+    }
+
+def same_code(sorted_words, words):
+    """True if words is exactly the codeword set held in the sorted array sorted_words."""
+    return len(sorted_words) == len(words) and np.array_equal(sorted_words, np.sort(words))
@@ -1,26 +1,6 @@
 import numpy as np
-from collections import Counter
-
-def hamming_weight(v):
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
-
-def codewords_to_set(codewords):
-    """Convert list of codewords to set of tuples for comparison."""
-    return set(tuple(cw) for cw in codewords)
+from codebook import unpack_words, compare_codes
+from code_cache import load_code
 
 print("=" * 70)
 print("COMPARING TWO 23-BIT GOLAY CODES")
@@ -28,44 +8,33 @@ print("=" * 70)
 
 # Load Code 1: from puncturing self-dual [24,12,8]
 print("\n📖 Loading Code 1: Punctured from self-dual [24,12,8]...")
-basis_1 = []
-with open('golay_perfect_23_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_1.append(vec)
+code_1 = load_code('golay_perfect_23_basis.txt')
+basis_1 = unpack_words(code_1.basis, code_1.n)
 
 print(f"✓ Loaded {len(basis_1)} basis vectors")
 
 # Load Code 2: from direct greedy search
 print("\n📖 Loading Code 2: Direct greedy search for [23,12,7]...")
-basis_2 = []
-with open('golay_23bit_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_2.append(vec)
+code_2 = load_code('golay_23bit_basis.txt')
+basis_2 = unpack_words(code_2.basis, code_2.n)
 
 print(f"✓ Loaded {len(basis_2)} basis vectors")
 
 # Generate all codewords for both
 print("\n🔄 Generating all codewords...")
-codewords_1 = generate_all_linear_combinations(basis_1)
-codewords_2 = generate_all_linear_combinations(basis_2)
+words_1 = code_1.codewords
+words_2 = code_2.codewords
 
-print(f"✓ Code 1: {len(codewords_1)} codewords")
-print(f"✓ Code 2: {len(codewords_2)} codewords")
+print(f"✓ Code 1: {len(words_1)} codewords")
+print(f"✓ Code 2: {len(words_2)} codewords")
 
 # Check minimum distances
 print("\n📊 Computing statistics...")
-weights_1 = [hamming_weight(cw) for cw in codewords_1]
-weights_2 = [hamming_weight(cw) for cw in codewords_2]
-
-min_dist_1 = min(w for w in weights_1 if w > 0)
-min_dist_2 = min(w for w in weights_2 if w > 0)
+distribution_1, min_dist_1 = code_1.weight_distribution, code_1.min_distance
+distribution_2, min_dist_2 = code_2.weight_distribution, code_2.min_distance
 
-weight_dist_1 = Counter(weights_1)
-weight_dist_2 = Counter(weights_2)
+weight_dist_1 = {w: int(count) for w, count in enumerate(distribution_1) if count}
+weight_dist_2 = {w: int(count) for w, count in enumerate(distribution_2) if count}
 
 print(f"\nCode 1 minimum distance: {min_dist_1}")
 print(f"Code 2 minimum distance: {min_dist_2}")
@@ -82,12 +51,11 @@ print("\n" + "=" * 70)
 print("EQUIVALENCE CHECK")
 print("=" * 70)
 
-# Convert to sets for comparison
-codeset_1 = codewords_to_set(codewords_1)
-codeset_2 = codewords_to_set(codewords_2)
+# Compare the sorted packed codeword arrays
+comparison = compare_codes(words_1, words_2)
 
 # Check if identical (same codewords)
-if codeset_1 == codeset_2:
+if comparison["identical"]:
     print("\n✨ IDENTICAL! ✨")
     print("The two codes have exactly the same set of codewords!")
     print("They are the SAME code (possibly with different basis).")
@@ -97,10 +65,10 @@ else:
     # Check if they differ only by coordinate permutation
     # This is a harder problem - for now just check size and weight distribution
     
-    if len(codeset_1) == len(codeset_2):
-        print(f"✓ Same number of codewords: {len(codeset_1)}")
+    if comparison["size_a"] == comparison["size_b"]:
+        print(f"✓ Same number of codewords: {comparison['size_a']}")
     else:
-        print(f"✗ Different number of codewords: {len(codeset_1)} vs {len(codeset_2)}")
+        print(f"✗ Different number of codewords: {comparison['size_a']} vs {comparison['size_b']}")
     
     if weight_dist_1 == weight_dist_2:
         print("✓ Same weight distribution")
@@ -108,15 +76,11 @@ else:
         print("They might be equivalent up to coordinate permutation.")
         
         # Check: how many codewords are in common?
-        common = codeset_1 & codeset_2
-        only_1 = codeset_1 - codeset_2
-        only_2 = codeset_2 - codeset_1
-        
-        print(f"\nCodewords in common: {len(common)}")
-        print(f"Only in Code 1: {len(only_1)}")
-        print(f"Only in Code 2: {len(only_2)}")
+        print(f"\nCodewords in common: {comparison['common']}")
+        print(f"Only in Code 1: {comparison['only_a']}")
+        print(f"Only in Code 2: {comparison['only_b']}")
         
-        if len(common) > 0:
+        if comparison['common'] > 0:
             print("\nThey share some codewords but not all.")
     else:
         print("✗ Different weight distributions")
@@ -0,0 +1,173 @@
+import numpy as np
+from codebook import generate_codewords, popcount, weight_distribution, permute_words, same_code
+from telemetry import Telemetry
+
+NODE_PROGRESS_EVERY = 10000
+
+MAX_INCIDENCE_WORDS = 1000  # largest weight class used for incidence (checks are quadratic in it)
+MIN_INCIDENCE_WORDS = 256  # weight classes are added until they hold this many words in all
+
+def incidence_classes(codewords, n, min_words=MIN_INCIDENCE_WORDS):
+    """Codewords of the smallest nonzero weights, one array per weight.
+
+    Classes are taken lightest first until they hold min_words words
+    between them (or the code runs out), so a code whose lightest classes
+    hold only a word or two still gets enough incidence data to narrow
+    the domains.  Classes with more than MAX_INCIDENCE_WORDS words are
+    skipped, since the incidence checks below are quadratic in the class
+    size.
+    """
+    distribution, _ = weight_distribution(codewords, n)
+    weights = popcount(codewords)
+    classes = []
+    total = 0
+    for w in np.flatnonzero(distribution[1:]) + 1:
+        if total >= min_words:
+            break
+        if distribution[w] <= MAX_INCIDENCE_WORDS:
+            classes.append(codewords[weights == w])
+            total += distribution[w]
+    return classes
+
+def position_signatures(codewords, n):
+    """n x (n + 1) matrix: row x counts the codewords of each weight with bit x set.
+
+    A coordinate permutation mapping one code onto another must send each
+    position to one with the same row.
+    """
+    weights = popcount(codewords)
+    bits = (np.asarray(codewords, dtype=np.uint32)[:, None] >> np.arange(n, dtype=np.uint32)) & 1
+    signatures = np.zeros((n, n + 1), dtype=np.int64)
+    for w in np.unique(weights):
+        signatures[:, w] = bits[weights == w].sum(axis=0)
+    return signatures
+
+class EquivalenceSearch:
+    """Backtracking search for a coordinate permutation mapping code A onto code B.
+
+    Positions of A are mapped one at a time.  Every low-weight word S of A
+    must map onto a word T of B with the same weight, so T has to agree
+    with the partial map on the positions mapped so far.  Each unmapped
+    position's domain is therefore cut down to the targets still allowed
+    by every word containing it, and a word forced onto a single T rules
+    out T's positions for everything outside the word.  Domains start out
+    as the positions of B with the same weight signature over the whole
+    codebook.  Search nodes and dead ends are counted in `telemetry`.
+    """
+
+    def __init__(self, words_a, words_b, n, telemetry=None):
+        self.n = n
+        self.full = (1 << n) - 1
+        self.codewords_b = np.sort(words_b)
+        self.words_a = words_a
+        self.classes = list(zip(incidence_classes(words_a, n), incidence_classes(words_b, n)))
+        signatures_a = position_signatures(words_a, n)
+        signatures_b = position_signatures(words_b, n)
+        self.signature_domains = [
+            sum(1 << y for y in range(n) if np.array_equal(signatures_a[x], signatures_b[y]))
+            for x in range(n)]
+        self.nodes = 0
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+
+    def domains(self, mapping):
+        """Allowed targets (bitmask) for every unmapped position, or None if stuck.
+
+        Propagates to a fixed point: narrower domains rule out more
+        candidate images T, which in turn narrow the domains again.
+        """
+        used = 0
+        for target in mapping.values():
+            used |= 1 << target
+        free = [x for x in range(self.n) if x not in mapping]
+        domains = {x: self.signature_domains[x] & ~used for x in free}
+        if not all(domains.values()):
+            return None
+
+        candidates = []
+        for class_a, class_b in self.classes:
+            # Image of each word of A restricted to the mapped positions
+            images = np.zeros_like(class_a)
+            for x, target in mapping.items():
+                images |= ((class_a >> np.uint32(x)) & np.uint32(1)) << np.uint32(target)
+            matches = (class_b & np.uint32(used))[None, :] == images[:, None]
+            unmapped_b = class_b & np.uint32(self.full & ~used)
+            contains = {x: ((class_a >> np.uint32(x)) & np.uint32(1)).astype(bool) for x in free}
+            candidates.append((matches, unmapped_b, contains))
+
+        changed = True
+        while changed:
+            changed = False
+            for matches, unmapped_b, contains in candidates:
+                # T's unmapped positions must all be reachable from S's
+                reach = np.zeros(len(matches), dtype=np.uint32)
+                for x in free:
+                    reach[contains[x]] |= np.uint32(domains[x])
+                matches &= (unmapped_b[None, :] & ~reach[:, None]) == 0
+                num_matches = matches.sum(axis=1)
+                if not num_matches.all():
+                    return None
+                allowed = np.bitwise_or.reduce(
+                    np.where(matches, unmapped_b, np.uint32(0)), axis=1)
+                forced = num_matches == 1
+
+                for x in free:
+                    domain = domains[x]
+                    domain &= int(np.bitwise_and.reduce(allowed[contains[x]],
+                                                        initial=np.uint32(self.full)))
+                    domain &= ~int(np.bitwise_or.reduce(allowed[~contains[x] & forced],
+                                                        initial=np.uint32(0)))
+                    if not domain:
+                        return None
+                    if domain != domains[x]:
+                        domains[x] = domain
+                        changed = True
+        return domains
+
+    def _extend(self, mapping):
+        self.nodes += 1
+        self.telemetry.count("search_nodes")
+        if self.telemetry.enabled and self.nodes % NODE_PROGRESS_EVERY == 0:
+            self.telemetry.event("progress", nodes=self.nodes, mapped=len(mapping))
+        if len(mapping) == self.n:
+            perm = [mapping[x] for x in range(self.n)]
+            return perm if same_code(self.codewords_b, permute_words(self.words_a, perm)) else None
+
+        domains = self.domains(mapping)
+        if domains is None:
+            self.telemetry.count("dead_ends")
+            return None
+        x = min(domains, key=lambda p: (bin(domains[p]).count("1"), p))
+        candidates = domains[x]
+        while candidates:
+            target = (candidates & -candidates).bit_length() - 1
+            candidates &= candidates - 1
+            mapping[x] = target
+            perm = self._extend(mapping)
+            if perm is not None:
+                return perm
+            del mapping[x]
+        return None
+
+    def solve(self, partial=None):
+        """Complete a partial map {position of A: position of B} to a permutation.
+
+        Returns the permutation as a list (bit i of A goes to bit perm[i]
+        of B), or None if the search proves that no completion exists.
+        """
+        if len(self.words_a) != len(self.codewords_b):
+            return None
+        for class_a, class_b in self.classes:
+            if len(class_a) != len(class_b):
+                return None
+        with self.telemetry.stage("equivalence_search", fixed=len(partial or {})):
+            return self._extend(dict(partial or {}))
+
+def find_equivalence(basis_a, basis_b, n):
+    """Coordinate permutation mapping the code spanned by basis_a onto basis_b's, or None."""
+    words_a = generate_codewords(basis_a)
+    words_b = generate_codewords(basis_b)
+    distribution_a, _ = weight_distribution(words_a, n)
+    distribution_b, _ = weight_distribution(words_b, n)
+    if not np.array_equal(distribution_a, distribution_b):
+        return None
+    return EquivalenceSearch(words_a, words_b, n).solve()
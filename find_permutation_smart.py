@@ -1,31 +1,8 @@
 import numpy as np
 from collections import defaultdict
-import time
-
-def hamming_weight(v):
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return np.array(codewords, dtype=int)
-
-def apply_permutation(codewords, perm):
-    """Apply coordinate permutation to all codewords."""
-    return codewords[:, perm]
-
-def codewords_to_set(codewords):
-    """Convert array of codewords to set of tuples."""
-    return set(tuple(cw) for cw in codewords)
+from codebook import unpack_words
+from code_cache import load_code
+from equivalence import EquivalenceSearch
 
 print("=" * 70)
 print("SMARTER PERMUTATION SEARCH USING WEIGHT SIGNATURES")
@@ -33,24 +10,13 @@ print("=" * 70)
 
 # Load both codes
 print("\n📖 Loading codes...")
-basis_1 = []
-with open('golay_perfect_23_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_1.append(vec)
-
-basis_2 = []
-with open('golay_23bit_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_2.append(vec)
+code_1 = load_code('golay_perfect_23_basis.txt')
+code_2 = load_code('golay_23bit_basis.txt')
 
 # Generate codewords
 print("🔄 Generating codewords...")
-codewords_1 = generate_all_linear_combinations(basis_1)
-codewords_2 = generate_all_linear_combinations(basis_2)
+codewords_1 = unpack_words(code_1.codewords, code_1.n)
+codewords_2 = unpack_words(code_2.codewords, code_2.n)
 print(f"✓ Generated {len(codewords_1)} codewords for each code")
 
 print("\n" + "=" * 70)
@@ -131,30 +97,34 @@ else:
         print(f"(vs. 23! = {math.factorial(23):.2e} for unconstrained)")
         
         if search_space < 1000000:
-            print("\n🎯 Search space is manageable! Trying all possibilities...")
-            # This is where we'd implement the actual search
-            # For now, let's just show it's feasible
+            print("\n🎯 Search space is manageable by brute force.")
         else:
             print("\n⚠️ Still too large to brute force easily.")
-            print("Need more sophisticated constraints or partial verification.")
+            print("Minimum-weight codeword incidence constrains it far more (below).")
 
 print("\n" + "=" * 70)
 print("CONCLUSION")
 print("=" * 70)
 
-# Even if we don't find the exact permutation, we can verify they're equivalent
-# through their identical weight distributions and perfect code properties
+# Coordinate weights can't tell positions apart, but weight-7/weight-8
+# codeword incidence can: map positions one at a time with backtracking
+search = EquivalenceSearch(code_1.codewords, code_2.codewords, 23)
+perm = search.solve()
+
 print("""
 We've verified that both codes:
   ✓ Are [23,12,7] codes
   ✓ Are perfect (spheres partition the space exactly)
   ✓ Have identical weight distributions
   ✓ Have identical coordinate weight profiles
-
-Since the binary Golay code is UNIQUE up to equivalence, these two
-codes MUST be equivalent via some coordinate permutation.
-
-Finding the exact permutation is computationally hard, but we've
-proven they're the same code!
 """)
 
+if perm is not None:
+    print(f"Backtracking over minimum-weight codeword incidence ({search.nodes} nodes)")
+    print("found an explicit permutation (position i → perm[i]):")
+    print(f"  {perm}")
+    print("\nSo they're the same code up to reordering coordinates!")
+else:
+    print("Backtracking over minimum-weight codeword incidence proved that")
+    print("NO coordinate permutation maps one code onto the other.")
+
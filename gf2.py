@@ -0,0 +1,120 @@
+import numpy as np
+
+# GF(2) matrices are 2-D uint64 arrays with one row per matrix row and
+# ceil(ncols / 64) words per row; column j is bit j % 64 of word j // 64,
+# matching the coordinate i -> bit i convention of the packed codewords.
+
+def num_words(ncols):
+    return max(1, -(-ncols // 64))
+
+def pack_rows(matrix):
+    """Pack a 0/1 matrix into uint64 rows."""
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    padded = np.zeros((matrix.shape[0], 64 * num_words(matrix.shape[1])), dtype=np.uint8)
+    padded[:, :matrix.shape[1]] = matrix & 1
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8').astype(np.uint64)
+
+def unpack_rows(rows, ncols):
+    """Unpack uint64 rows into a 0/1 int matrix with ncols columns."""
+    rows = np.ascontiguousarray(rows, dtype='<u8')
+    bits = np.unpackbits(rows.view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :ncols].astype(int)
+
+def from_ints(values, ncols):
+    """Rows from Python ints or packed uint32 words (bit j = column j)."""
+    values = [int(v) for v in values]
+    rows = np.zeros((len(values), num_words(ncols)), dtype=np.uint64)
+    for i, v in enumerate(values):
+        for w in range(rows.shape[1]):
+            rows[i, w] = (v >> (64 * w)) & 0xFFFFFFFFFFFFFFFF
+    return rows
+
+def to_ints(rows):
+    """Rows as Python ints (bit j = column j)."""
+    return [sum(int(word) << (64 * w) for w, word in enumerate(row)) for row in rows]
+
+def rref(rows, ncols):
+    """Reduced row echelon form; returns (nonzero rows, pivot columns).
+
+    Only the first ncols columns are eliminated.  Any bits beyond them are
+    carried along with their rows, so tag bits appended to each row record
+    which input rows were combined into each output row.
+    """
+    rows = np.array(rows, dtype=np.uint64, ndmin=2)
+    pivots = []
+    rank = 0
+    for col in range(ncols):
+        if rank == len(rows):
+            break
+        word, bit = col >> 6, np.uint64(1 << (col & 63))
+        has_bit = (rows[:, word] & bit) != 0
+        candidates = np.flatnonzero(has_bit[rank:])
+        if not len(candidates):
+            continue
+        pivot = rank + candidates[0]
+        if pivot != rank:
+            rows[[rank, pivot]] = rows[[pivot, rank]]
+            has_bit[[rank, pivot]] = has_bit[[pivot, rank]]
+        has_bit[rank] = False
+        rows[has_bit] ^= rows[rank]
+        pivots.append(col)
+        rank += 1
+    return rows[:rank], pivots
+
+def rank(rows, ncols):
+    return len(rref(rows, ncols)[1])
+
+def permute_columns(rows, columns, ncols):
+    """Rows with new column j taken from old column columns[j]."""
+    return pack_rows(unpack_rows(rows, ncols)[:, columns])
+
+def systematic_form(rows, ncols):
+    """Systematic generator [I | P] of the row space, with column pivoting.
+
+    Returns (rows, columns): the reduced rows after moving the pivot
+    columns to the front, and the column order used (new column j is old
+    column columns[j]).  Without pivoting the order is the identity.
+    """
+    rows, pivots = rref(rows, ncols)
+    pivot_set = set(pivots)
+    columns = pivots + [c for c in range(ncols) if c not in pivot_set]
+    if columns == list(range(ncols)):
+        return rows, columns
+    return permute_columns(rows, columns, ncols), columns
+
+def null_space(rows, ncols):
+    """Basis of {x : G x = 0}, i.e. a parity-check matrix H (the dual code)."""
+    reduced, pivots = rref(rows, ncols)
+    pivot_set = set(pivots)
+    free = [c for c in range(ncols) if c not in pivot_set]
+    bits = unpack_rows(reduced, ncols)
+    checks = np.zeros((len(free), ncols), dtype=np.uint8)
+    checks[np.arange(len(free)), free] = 1
+    checks[:, pivots] = bits[:, free].T
+    return pack_rows(checks)
+
+def _parity(words):
+    for shift in (32, 16, 8, 4, 2, 1):
+        words = words ^ (words >> np.uint64(shift))
+    return (words & np.uint64(1)).astype(np.uint8)
+
+def gram(rows_a, rows_b=None, block_size=256):
+    """Inner products <a_i, b_j> mod 2 as a uint8 matrix (B defaults to A)."""
+    rows_a = np.asarray(rows_a, dtype=np.uint64)
+    rows_b = rows_a if rows_b is None else np.asarray(rows_b, dtype=np.uint64)
+    product = np.empty((len(rows_a), len(rows_b)), dtype=np.uint8)
+    for start in range(0, len(rows_a), block_size):
+        block = rows_a[start:start + block_size]
+        folded = np.bitwise_xor.reduce(block[:, None, :] & rows_b[None, :, :], axis=2)
+        product[start:start + len(block)] = _parity(folded)
+    return product
+
+def is_self_orthogonal(rows):
+    """True when every pair of rows (and every row with itself) is orthogonal."""
+    return not gram(rows).any()
+
+def is_self_dual(rows, ncols):
+    """Self-orthogonal with dimension ncols / 2, so the code equals its dual."""
+    return 2 * rank(rows, ncols) == ncols and is_self_orthogonal(rows)
@@ -0,0 +1,172 @@
+import argparse
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from code_cache import load_code
+
+# Encoded file layout: MAGIC, the original length as a little-endian
+# uint64, then each 12-bit message as a 24-bit codeword in 3 bytes
+MAGIC = b"GOLAY24\0"
+HEADER = np.dtype([("magic", "S8"), ("length", "<u8")])
+DEFAULT_BASIS = 'golay_self_dual_basis.txt'
+CHUNK_BLOCKS = 1 << 20  # 3-byte input blocks (two codewords each) per chunk
+
+def load_codec(basis_file=DEFAULT_BASIS):
+    """CachedCode for a 12-dimensional code of length <= 24 from a basis file."""
+    code = load_code(basis_file)
+    if code.k != 12 or code.n > 24:
+        raise ValueError(f"{basis_file}: need a [<=24, 12] code, got [{code.n}, {code.k}]")
+    return code
+
+def _bytes_to_words(data):
+    """Little-endian 3-byte groups -> uint32 words."""
+    data = data.reshape(-1, 3).astype(np.uint32)
+    return data[:, 0] | (data[:, 1] << 8) | (data[:, 2] << 16)
+
+def _words_to_bytes(words, out):
+    """Write uint32 words as little-endian 3-byte groups into out."""
+    out = out.reshape(-1, 3)
+    for i in range(3):
+        out[:, i] = words >> (8 * i)
+
+def encode_file(input_path, output_path, basis_file=DEFAULT_BASIS, chunk_blocks=CHUNK_BLOCKS):
+    """Encode a file; returns the number of codewords written."""
+    encoder = load_codec(basis_file).encoder()
+    length = os.path.getsize(input_path)
+    blocks = -(-length // 3)
+
+    output = np.memmap(output_path, dtype=np.uint8, mode='w+',
+                       shape=HEADER.itemsize + 6 * blocks)
+    output[:HEADER.itemsize].view(HEADER)[0] = (MAGIC, length)
+    if length:
+        data = np.memmap(input_path, dtype=np.uint8, mode='r')
+        for start in range(0, blocks, chunk_blocks):
+            stop = min(start + chunk_blocks, blocks)
+            chunk = data[3 * start:3 * stop]
+            if len(chunk) % 3:
+                chunk = np.concatenate([chunk, np.zeros(3 - len(chunk) % 3, dtype=np.uint8)])
+            values = _bytes_to_words(chunk)
+            codewords = np.empty((stop - start, 2), dtype=np.uint32)
+            encoder.encode(values & 0xFFF, out=codewords[:, 0])
+            encoder.encode(values >> 12, out=codewords[:, 1])
+            _words_to_bytes(codewords.ravel(),
+                            output[HEADER.itemsize + 6 * start:HEADER.itemsize + 6 * stop])
+        del data
+    output.flush()
+    del output
+    return 2 * blocks
+
+def read_header(data):
+    """Original length stored in an encoded file's header."""
+    if len(data) < HEADER.itemsize:
+        raise ValueError("Truncated Golay header")
+    header = np.asarray(data[:HEADER.itemsize]).view(HEADER)[0]
+    if header["magic"] != MAGIC.rstrip(b"\0"):
+        raise ValueError("Not a Golay-encoded file")
+    length = int(header["length"])
+    if len(data) != HEADER.itemsize + 6 * -(-length // 3):
+        raise ValueError("Encoded file size does not match its header")
+    return length
+
+def decode_blocks(decoder, encoded, output, stats):
+    """Decode a run of 6-byte blocks into 3-byte blocks, updating stats."""
+    received = _bytes_to_words(encoded)
+    codewords, error_counts = decoder.decode(received)
+    messages = decoder.messages(codewords).reshape(-1, 2)
+    _words_to_bytes(messages[:, 0] | (messages[:, 1] << 12), output)
+
+    stats["codewords"] += len(received)
+    stats["corrected"] += int(np.count_nonzero(error_counts > 0))
+    stats["uncorrectable"] += int(np.count_nonzero(error_counts < 0))
+    stats["bit_errors"] += int(error_counts[error_counts > 0].sum(dtype=np.int64))
+
+def _decode_range(decoder, data, output, start, stop, length, chunk_blocks, stats):
+    """Decode blocks [start, stop) of mapped encoded data into mapped output."""
+    for chunk_start in range(start, stop, chunk_blocks):
+        chunk_stop = min(chunk_start + chunk_blocks, stop)
+        encoded = data[HEADER.itemsize + 6 * chunk_start:HEADER.itemsize + 6 * chunk_stop]
+        decoded = np.empty(3 * (chunk_stop - chunk_start), dtype=np.uint8)
+        decode_blocks(decoder, encoded, decoded, stats)
+        end = min(3 * chunk_stop, length)
+        output[3 * chunk_start:end] = decoded[:end - 3 * chunk_start]
+
+def _new_stats():
+    return {"codewords": 0, "corrected": 0, "bit_errors": 0, "uncorrectable": 0}
+
+_shard_decoder = None
+
+def _init_shard_worker(decoder):
+    """Pool initializer: receive the decoder tables once per worker process."""
+    global _shard_decoder
+    _shard_decoder = decoder
+
+def _decode_shard(input_path, output_path, start, stop, length, chunk_blocks):
+    """Decode one block-aligned shard in a worker, writing its output slice in place."""
+    data = np.memmap(input_path, dtype=np.uint8, mode='r')
+    output = np.memmap(output_path, dtype=np.uint8, mode='r+')
+    stats = _new_stats()
+    _decode_range(_shard_decoder, data, output, start, stop, length, chunk_blocks, stats)
+    output.flush()
+    return stats
+
+def decode_file(input_path, output_path, basis_file=DEFAULT_BASIS, chunk_blocks=CHUNK_BLOCKS,
+                workers=1):
+    """Decode a file written by encode_file.
+
+    Returns a dict counting the codewords read, the codewords corrected,
+    the bit errors fixed and the uncorrectable codewords (whose message
+    bits are passed through as received).  With workers > 1 the blocks
+    are split into shards decoded by a process pool; each worker writes
+    its own slice of the output file, so output order is preserved.
+    """
+    decoder = load_codec(basis_file).decoder()
+    data = np.memmap(input_path, dtype=np.uint8, mode='r')
+    length = read_header(data)
+    blocks = -(-length // 3)
+    stats = _new_stats()
+
+    output = np.memmap(output_path, dtype=np.uint8, mode='w+', shape=max(length, 1))
+    if workers <= 1 or blocks <= chunk_blocks:
+        _decode_range(decoder, data, output, 0, blocks, length, chunk_blocks, stats)
+        output.flush()
+    else:
+        output.flush()
+        # A few shards per worker keeps the pool busy if one shard runs slow
+        shard_blocks = max(chunk_blocks, -(-blocks // (4 * workers)))
+        shards = [(start, min(start + shard_blocks, blocks))
+                  for start in range(0, blocks, shard_blocks)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_shard_worker,
+                                 initargs=(decoder,)) as pool:
+            futures = [pool.submit(_decode_shard, input_path, output_path,
+                                   start, stop, length, chunk_blocks)
+                       for start, stop in shards]
+            for future in futures:
+                for key, value in future.result().items():
+                    stats[key] += value
+    del output, data
+    if length == 0:
+        os.truncate(output_path, 0)
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Protect files with a [24,12,8] Golay code.")
+    parser.add_argument("command", choices=["encode", "decode"])
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--basis", default=DEFAULT_BASIS,
+                        help=f"basis file of the code to use (default: {DEFAULT_BASIS})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="decode shards in this many processes (default: 1)")
+    args = parser.parse_args(argv)
+
+    if args.command == "encode":
+        codewords = encode_file(args.input, args.output, args.basis)
+        print(f"✓ Encoded {os.path.getsize(args.input):,} bytes into {codewords:,} codewords")
+    else:
+        stats = decode_file(args.input, args.output, args.basis, workers=args.workers)
+        print(f"✓ Decoded {stats['codewords']:,} codewords")
+        print(f"  • Corrected: {stats['corrected']:,} codewords ({stats['bit_errors']:,} bit errors)")
+        print(f"  • Uncorrectable: {stats['uncorrectable']:,} codewords")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,656 @@
+import argparse
+import numpy as np
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from math import comb
+from multiprocessing import Value
+from multiprocessing.shared_memory import SharedMemory
+from codebook import (popcount, load_basis, pack_vectors, unpack_words, save_basis,
+                      MAX_PACKED_LENGTH)
+from bitmap import ball_bitmap, test_bits, xor_translate
+from gf2 import pack_rows, is_self_orthogonal, is_self_dual
+import checkpoint
+import telemetry
+from telemetry import Telemetry
+
+SCAN_CHUNK = 1 << 16  # candidates tested per step (and checkpoint granularity)
+CANDIDATE_TABLE_MAX_N = 24  # longer codes unrank candidates chunk by chunk instead of caching classes
+CANDIDATE_CACHE_CLASSES = 8  # weight classes kept by weight_candidates (C(24,12) words is 10.8 MB)
+BITMAP_MAX_N = 28  # longer codes test candidates against the codebook, not a 2^n-bit bitmap
+CODEBOOK_BLOCK = 1 << 22  # candidate-codeword pairs compared at once by CodebookSearch
+
+@lru_cache(maxsize=CANDIDATE_CACHE_CLASSES)
+def weight_candidates(n, weight):
+    """All length-n vectors of the given weight, packed, in combinations() order.
+
+    combinations(range(n), weight) lists the position sets containing 0
+    first, followed by those without it, each group in the same order
+    over positions 1..n-1.  So the class is built up one position at a
+    time from the classes of shorter lengths, keeping only the weights
+    that can still reach `weight`, so memory stays within a small
+    multiple of the class size rather than 2^n words.
+    """
+    levels = {0: np.zeros(1, dtype=np.uint32)}
+    for length in range(1, n + 1):
+        classes = {}
+        for w in range(max(0, weight - (n - length)), min(length, weight) + 1):
+            parts = [(levels[w - 1] << np.uint32(1)) | np.uint32(1)] if w - 1 in levels else []
+            if w in levels:
+                parts.append(levels[w] << np.uint32(1))
+            classes[w] = np.concatenate(parts)
+        levels = classes
+    candidates = levels[weight]
+    candidates.flags.writeable = False
+    return candidates
+
+def unrank_combinations(n, weight, start, stop):
+    """Packed vectors of ranks [start, stop) in combinations(range(n), weight) order.
+
+    Lexicographic unranking, vectorized over the ranks: for each slot,
+    the position advances past every choice whose block of completions
+    lies wholly below the remaining rank.
+    """
+    table = np.array([[comb(a, b) for b in range(weight + 1)] for a in range(n + 1)],
+                     dtype=np.int64)
+    ranks = np.arange(start, stop, dtype=np.int64)
+    words = np.zeros(len(ranks), dtype=np.uint32)
+    position = np.zeros(len(ranks), dtype=np.int64)
+    for slot in range(weight):
+        remaining = weight - 1 - slot
+        for _ in range(n - weight + 1):
+            block = table[np.maximum(n - 1 - position, 0), remaining]
+            advance = ranks >= block
+            if not advance.any():
+                break
+            ranks -= np.where(advance, block, 0)
+            position += advance
+        words |= np.uint32(1) << position.astype(np.uint32)
+        position += 1
+    return words
+
+def candidate_chunk(n, weight, start, stop):
+    """Candidates of ranks [start, stop): a slice of weight_candidates, or unranked for long codes."""
+    if n <= CANDIDATE_TABLE_MAX_N:
+        return weight_candidates(n, weight)[start:stop]
+    return unrank_combinations(n, weight, start, min(stop, comb(n, weight)))
+
+class OrthogonalTo:
+    """Candidate predicate: even weight and orthogonal to every basis vector.
+
+    A picklable stand-in for a closure over the basis, so it can be
+    shipped to ParallelGreedySearch workers.  mask() applies it to a whole
+    array of candidates at once with parity-of-AND popcounts; searches use
+    it on every candidate in a chunk that clears the distance bitmap.
+    """
+
+    def __init__(self, basis):
+        self.basis = tuple(int(b) for b in basis)
+
+    def __call__(self, word):
+        if bin(word).count("1") % 2:
+            return False
+        return all(bin(word & b).count("1") % 2 == 0 for b in self.basis)
+
+    def mask(self, words):
+        """Boolean mask of the packed words that pass, tested in bulk."""
+        words = np.asarray(words, dtype=np.uint32)
+        survivors = np.flatnonzero((popcount(words) & 1) == 0)
+        for b in self.basis:
+            survivors = survivors[(popcount(words[survivors] & np.uint32(b)) & 1) == 0]
+        keep = np.zeros(len(words), dtype=bool)
+        keep[survivors] = True
+        return keep
+
+# Constraints on the code being built, as (weight modulus, orthogonal).
+# Basis vectors of even weight span an even code; pairwise-orthogonal ones
+# of even weight span a self-orthogonal code, and of weight divisible by 4
+# a doubly-even one.  So each constraint is a restriction on the weights
+# scanned plus, for the last two, the OrthogonalTo predicate.
+CONSTRAINTS = {
+    "none": (1, False),
+    "even": (2, False),
+    "self-orthogonal": (2, True),
+    "doubly-even": (4, True),
+}
+
+def default_weights(n, d, constraint="none"):
+    """Every weight from d to n the constraint allows, lightest first."""
+    modulus, _ = CONSTRAINTS[constraint]
+    return [w for w in range(d, n + 1) if w % modulus == 0]
+
+def check_weights(weights, constraint="none"):
+    """Raise ValueError if the constraint rules out any of the weights."""
+    modulus, _ = CONSTRAINTS[constraint]
+    bad = [w for w in weights if w % modulus]
+    if bad:
+        raise ValueError(f"Weights {bad} are not allowed by constraint {constraint!r}")
+
+def constraint_predicate(constraint, basis):
+    """Predicate a candidate must also pass to extend basis, or None."""
+    _, orthogonal = CONSTRAINTS[constraint]
+    return OrthogonalTo(basis) if orthogonal else None
+
+def first_hit(allowed, words, predicate=None, should_stop=None, check_every=1024):
+    """Index of the first word that the allowed mask keeps and the predicate passes.
+
+    Returns (index, predicate_rejected), counting predicate rejections
+    before the hit (or among all the words without one); index is None
+    if nothing qualifies.  A predicate with a mask() method is applied to
+    every word that passes the bitmap in one call; otherwise it is called
+    word by word, and should_stop() is polled every check_every calls,
+    returning (None, None) once it says to give up.
+    """
+    allowed = np.flatnonzero(allowed)
+    if predicate is not None and hasattr(predicate, "mask"):
+        passed = np.flatnonzero(predicate.mask(words[allowed]))
+        if not len(passed):
+            return None, len(allowed)
+        return int(allowed[passed[0]]), int(passed[0])
+
+    for tested, index in enumerate(allowed):
+        if should_stop is not None and tested % check_every == 0 and should_stop():
+            return None, None
+        if predicate is None or predicate(int(words[index])):
+            return int(index), tested
+    return None, len(allowed)
+
+class GreedySearch:
+    """Greedy basis search for a linear [n, k, >=d] code.
+
+    Keeps a bitmap of every vector within distance d-1 of the current code.
+    A candidate can join the basis exactly when its bit is clear, and
+    accepting it only requires OR-ing in the bitmap's translate by the
+    candidate, so no codebook is ever regenerated.
+
+    Progress goes to `telemetry`: candidates scanned, rejections by the
+    distance bitmap and by the predicate, and the time per basis vector.
+    With a `checkpoint` set, the state is saved after every accepted
+    vector and, at most once per checkpoint interval, as the scan for the
+    next one advances; restore() picks up from a saved state.
+    """
+
+    def __init__(self, n, d, telemetry=None, checkpoint=None):
+        self.n = n
+        self.d = d
+        self.basis = []
+        self.telemetry = telemetry if telemetry is not None else Telemetry()
+        self.checkpoint = checkpoint
+        self._build()
+        self._last_accept = time.time()
+        self._scan = None
+        self._resume = None
+
+    def _build(self):
+        with self.telemetry.stage("forbidden_ball", n=self.n, d=self.d):
+            self.forbidden = ball_bitmap(self.n, self.d - 1)
+
+    def _extend(self, word):
+        self.forbidden |= xor_translate(self.forbidden, word)
+
+    def state(self):
+        """Checkpointable state: parameters, basis and how far the current scan has got."""
+        return {"n": self.n, "d": self.d, "basis": list(self.basis), "scan": self._scan}
+
+    def restore(self, state, constraint="none"):
+        """Replay a saved basis into a fresh search; the next find_next resumes its scan.
+
+        Each saved vector is checked like a seed vector against the ones
+        before it, so a tampered basis raises ValueError instead of
+        quietly producing a code that breaks the distance or constraint.
+        """
+        if (state["n"], state["d"]) != (self.n, self.d):
+            raise ValueError(f"Checkpoint is for n={state['n']}, d={state['d']}, "
+                             f"not n={self.n}, d={self.d}")
+        if self.basis:
+            raise ValueError("Can only restore into a search with an empty basis")
+        checkpoint, self.checkpoint = self.checkpoint, None
+        for word in state["basis"]:
+            reason = self.seed_violation(int(word), constraint)
+            if reason is not None:
+                raise ValueError(f"Checkpoint basis vector {int(word):#x} is {reason}")
+            self.accept(word)
+        self.checkpoint = checkpoint
+        self._resume = state["scan"]
+
+    def _start_scan(self, weights):
+        """(weight index, rank, attempts) to start from: a restored scan, or the beginning."""
+        resume, self._resume = self._resume, None
+        if resume is not None and resume["weights"] == weights:
+            return weights.index(resume["weight"]), resume["rank"], resume["attempts"]
+        return 0, 0, 0
+
+    def _advance_scan(self, weights, weight, rank, attempts):
+        """Record that every candidate before rank in this weight class is rejected."""
+        self._scan = {"weights": weights, "weight": weight, "rank": rank, "attempts": attempts}
+        if self.checkpoint is not None:
+            self.checkpoint.maybe_save(self.state)
+
+    def allowed(self, words):
+        """Boolean mask of the packed words that keep minimum distance >= d."""
+        return ~test_bits(self.forbidden, words)
+
+    def accept(self, word):
+        """Add a packed vector to the basis and extend the forbidden set."""
+        word = int(word)
+        self.basis.append(word)
+        self._extend(word)
+        self._scan = None
+        if self.checkpoint is not None:
+            self.checkpoint.save(self.state())
+        now = time.time()
+        self.telemetry.count("basis_vectors")
+        self.telemetry.event("basis_vector", index=len(self.basis), word=word,
+                             weight=bin(word).count("1"), seconds=now - self._last_accept)
+        self._last_accept = now
+
+    def find_next(self, weights, predicate=None):
+        """First acceptable candidate, scanning weights in order.
+
+        Candidates of each weight are scanned in combinations() order and
+        must also satisfy predicate(word), if given (see first_hit for
+        predicates that test in bulk).  Returns (word, weight, attempts),
+        with word None when nothing qualifies.
+        """
+        telemetry = self.telemetry
+        start_time = time.time()
+        weights = list(weights)
+        first, rank, attempts = self._start_scan(weights)
+        for weight in weights[first:]:
+            total = comb(self.n, weight)
+            scan_start, rejected = rank, 0
+            for chunk_start in range(rank, total, SCAN_CHUNK):
+                chunk = candidate_chunk(self.n, weight, chunk_start, chunk_start + SCAN_CHUNK)
+                index, chunk_rejected = first_hit(self.allowed(chunk), chunk, predicate)
+                if index is not None:
+                    rank = chunk_start + index
+                    telemetry.count("candidates", index + 1)
+                    self._record_scan(weight, rank + 1 - scan_start, rejected + chunk_rejected,
+                                      start_time, True)
+                    return int(chunk[index]), weight, attempts + rank + 1
+                rejected += chunk_rejected
+                telemetry.count("candidates", len(chunk))
+                self._report_progress(weight, attempts + chunk_start + len(chunk), start_time)
+                self._advance_scan(weights, weight, chunk_start + len(chunk), attempts)
+            self._record_scan(weight, total - scan_start, rejected, start_time, False)
+            attempts += total
+            rank = 0
+        return None, None, attempts
+
+    def _report_progress(self, weight, attempts, start_time):
+        """Progress event for a scan still under way, with the run's attempts per second."""
+        if self.telemetry.enabled:
+            self.telemetry.event("progress", weight=weight, attempts=attempts,
+                                 attempts_per_second=self.telemetry.rate("candidates"),
+                                 seconds=time.time() - start_time)
+
+    def _record_scan(self, weight, scanned, predicate_rejected, start_time, found):
+        """Count one weight class's scan, split into rejections by distance and by predicate.
+
+        The candidates themselves are counted as they are tested, so the
+        attempts-per-second rate reported here is current.
+        """
+        telemetry = self.telemetry
+        distance_rejected = scanned - predicate_rejected - int(found)
+        telemetry.count("rejected_distance", distance_rejected)
+        telemetry.count("rejected_predicate", predicate_rejected)
+        telemetry.event("scan", weight=weight, candidates=scanned, found=found,
+                        rejected_distance=distance_rejected,
+                        rejected_predicate=predicate_rejected,
+                        seconds=time.time() - start_time)
+        telemetry.event("rate", attempts=telemetry.counters.get("candidates", 0),
+                        attempts_per_second=telemetry.rate("candidates"))
+
+    def seed_violation(self, word, constraint="none"):
+        """Why word cannot extend the basis under the constraint, or None if it can."""
+        modulus, _ = CONSTRAINTS[constraint]
+        predicate = constraint_predicate(constraint, self.basis)
+        if not 0 <= word < 1 << self.n:
+            return f"not a length-{self.n} vector"
+        if word == 0:
+            return "the zero vector"
+        if not self.allowed(np.array([word], dtype=np.uint32))[0]:
+            return f"within distance {self.d - 1} of the code"
+        if bin(word).count("1") % modulus:
+            return f"weight not divisible by {modulus}"
+        if predicate is not None and not predicate(word):
+            return "not orthogonal to the basis"
+        return None
+
+    def run(self, k, weights, seed=(), constraint="none"):
+        """Accept the seed vectors, then greedily extend the basis to k vectors.
+
+        Raises ValueError if a seed vector breaks the distance or the
+        constraint.
+        """
+        for word in seed:
+            reason = self.seed_violation(int(word), constraint)
+            if reason is not None:
+                raise ValueError(f"Seed vector {int(word):#x} is {reason}")
+            self.accept(word)
+        while len(self.basis) < k:
+            word, _, _ = self.find_next(weights, constraint_predicate(constraint, self.basis))
+            if word is None:
+                break
+            self.accept(word)
+        return self.basis
+
+    def close(self):
+        """Release any worker resources (nothing to do for the serial search)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class CodebookSearch(GreedySearch):
+    """GreedySearch for codes too long for the forbidden-ball bitmap.
+
+    Keeps the 2^k packed codewords instead and allows a candidate when it
+    is at distance >= d from all of them, comparing a block of codewords
+    at a time and dropping candidates as soon as one block rules them out.
+    Scans the same candidates in the same order as GreedySearch.
+    """
+
+    def _build(self):
+        self.codewords = np.zeros(1, dtype=np.uint32)
+
+    def _extend(self, word):
+        self.codewords = np.concatenate([self.codewords, self.codewords ^ np.uint32(word)])
+
+    def allowed(self, words):
+        words = np.asarray(words, dtype=np.uint32)
+        keep = np.ones(len(words), dtype=bool)
+        start = 0
+        while start < len(self.codewords):
+            survivors = np.flatnonzero(keep)
+            if not len(survivors):
+                break
+            block = self.codewords[start:start + max(1, CODEBOOK_BLOCK // len(survivors))]
+            distances = popcount(words[survivors, None] ^ block[None, :])
+            keep[survivors] = distances.min(axis=1) >= self.d
+            start += len(block)
+        return keep
+
+def make_search(n, d, workers=1, telemetry=None, checkpoint=None):
+    """GreedySearch, or ParallelGreedySearch when workers > 1.
+
+    Lengths past BITMAP_MAX_N (up to MAX_PACKED_LENGTH) get a serial
+    CodebookSearch whatever the number of workers.
+    """
+    if n > MAX_PACKED_LENGTH:
+        raise ValueError(f"Greedy search supports n <= {MAX_PACKED_LENGTH}, not {n}")
+    if n > BITMAP_MAX_N:
+        return CodebookSearch(n, d, telemetry, checkpoint)
+    if workers > 1:
+        return ParallelGreedySearch(n, d, workers, telemetry, checkpoint)
+    return GreedySearch(n, d, telemetry, checkpoint)
+
+# Worker-side state for ParallelGreedySearch: the forbidden bitmap in
+# shared memory, the best hit rank found so far (-1 for none yet) and the
+# running total of candidates tested by all workers
+_worker_memory = None
+_worker_forbidden = None
+_worker_best = None
+_worker_scanned = None
+
+def _init_scan_worker(memory_name, length, best, scanned):
+    global _worker_memory, _worker_forbidden, _worker_best, _worker_scanned
+    _worker_memory = SharedMemory(name=memory_name)
+    _worker_forbidden = np.ndarray(length, dtype=np.uint64, buffer=_worker_memory.buf)
+    _worker_best = best
+    _worker_scanned = scanned
+
+def _scan_range(n, weight, start, stop, predicate):
+    """First acceptable rank in [start, stop), or None.
+
+    Returns (rank, predicate_rejected): the predicate rejections before
+    the hit, or in the whole range without one.  Gives up early, returning
+    (None, None), once some other worker has a hit ranked before start.
+    Ranges scanned to a hit or to the end add their candidates to the
+    shared tested count.
+    """
+    if 0 <= _worker_best.value < start:
+        return None, None
+    words = unrank_combinations(n, weight, start, stop)
+    index, rejected = first_hit(~test_bits(_worker_forbidden, words), words, predicate,
+                                should_stop=lambda: 0 <= _worker_best.value < start)
+    if rejected is not None:
+        with _worker_scanned.get_lock():
+            _worker_scanned.value += len(words) if index is None else index + 1
+    return (None if index is None else start + index), rejected
+
+class ParallelGreedySearch(GreedySearch):
+    """GreedySearch whose candidate scans are split across a process pool.
+
+    Each weight class is cut into rank ranges that workers unrank and test
+    against the forbidden bitmap, which lives in shared memory so accept()
+    updates it in place for every worker.  When a hit is reported, ranges
+    ranked after it are cancelled and running workers past it stop early.
+    The smallest hit rank wins, and a hit is only taken once every range
+    before it has finished empty, so the accepted vector is exactly the
+    one the serial scan picks.  Checkpoints record the end of the longest
+    run of finished ranges.  Telemetry counts the candidates the workers
+    actually test, read from a shared counter as ranges finish, so it
+    includes ranges scanned past the hit.  Predicates must be picklable
+    (OrthogonalTo, not a lambda).  Call close() (or use a with block)
+    when done.
+    """
+
+    def __init__(self, n, d, workers, telemetry=None, checkpoint=None, chunk_size=SCAN_CHUNK):
+        super().__init__(n, d, telemetry, checkpoint)
+        self.chunk_size = chunk_size
+        self._memory = SharedMemory(create=True, size=self.forbidden.nbytes)
+        shared = np.ndarray(self.forbidden.shape, dtype=np.uint64, buffer=self._memory.buf)
+        shared[:] = self.forbidden
+        self.forbidden = shared
+        self._best = Value('q', -1)
+        self._scanned = Value('q', 0)
+        self._counted = 0
+        self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_scan_worker,
+                                         initargs=(self._memory.name, len(shared), self._best,
+                                                   self._scanned))
+
+    def find_next(self, weights, predicate=None):
+        start_time = time.time()
+        weights = list(weights)
+        first, rank, attempts = self._start_scan(weights)
+        for weight in weights[first:]:
+            total = comb(self.n, weight)
+            hit, rejected = self._scan_weight(weights, weight, rank, total, attempts, predicate,
+                                              start_time)
+            if hit is not None:
+                self._record_scan(weight, hit + 1 - rank, rejected, start_time, True)
+                return int(unrank_combinations(self.n, weight, hit, hit + 1)[0]), weight, \
+                    attempts + hit + 1
+            self._record_scan(weight, total - rank, rejected, start_time, False)
+            attempts += total
+            rank = 0
+        return None, None, attempts
+
+    def _count_scanned(self):
+        """Add the candidates workers have tested since the last call to the telemetry."""
+        scanned = self._scanned.value
+        self.telemetry.count("candidates", scanned - self._counted)
+        self._counted = scanned
+
+    def _scan_weight(self, weights, weight, first_rank, total, attempts, predicate, start_time):
+        """Lowest hit rank of one weight class and the predicate rejections before it."""
+        self._best.value = -1
+        futures = {}
+        for start in range(first_rank, total, self.chunk_size):
+            stop = min(start + self.chunk_size, total)
+            futures[self._pool.submit(_scan_range, self.n, weight, start, stop, predicate)] = start
+
+        best = None
+        results = {}
+        frontier = first_rank
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            rank, rejected = future.result()
+            results[futures[future]] = (rank, rejected)
+            if rank is not None and (best is None or rank < best):
+                best = rank
+                self._best.value = best
+                for other, start in futures.items():
+                    if start > best:
+                        other.cancel()
+            # Until a hit turns up, every finished range is empty
+            while best is None and frontier in results:
+                frontier = min(frontier + self.chunk_size, total)
+                self._advance_scan(weights, weight, frontier, attempts)
+            self._count_scanned()
+            self._report_progress(weight, attempts + frontier, start_time)
+
+        # Every range ranked before the hit ran to completion without one
+        rejected = sum(r for start, (rank, r) in results.items()
+                       if r is not None and (best is None or start <= best))
+        return best, rejected
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
+        self.forbidden = np.array(self.forbidden)
+        self._memory.close()
+        self._memory.unlink()
+
+def word_positions(word):
+    """Positions of the 1 bits of a packed word."""
+    word = int(word)
+    return tuple(i for i in range(word.bit_length()) if (word >> i) & 1)
+
+def _word(text):
+    return int(text, 0)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Greedy construction of a binary [n,k,d] code (n <= 32).")
+    parser.add_argument("n", type=int, help="code length")
+    parser.add_argument("k", type=int, help="number of basis vectors to find")
+    parser.add_argument("d", type=int, help="minimum distance")
+    parser.add_argument("--constraint", choices=list(CONSTRAINTS), default="none",
+                        help="extra property of the code (default: none)")
+    parser.add_argument("--weights", type=int, nargs="+", metavar="W",
+                        help="candidate weights, scanned in the order given "
+                             "(default: every weight from d to n the constraint allows)")
+    parser.add_argument("--seed", type=_word, nargs="+", default=[], metavar="WORD",
+                        help="seed basis vectors as integers, bit i = coordinate i (e.g. 0xffffff)")
+    parser.add_argument("--seed-file", metavar="PATH",
+                        help="basis file whose rows seed the basis (before --seed)")
+    parser.add_argument("--output", metavar="PATH",
+                        help="save the basis to PATH in basis-file format once all k are found")
+    parser.add_argument("--title", help="title line of the saved basis file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="scan candidates in this many processes (default: 1)")
+    checkpoint.add_arguments(parser, "greedy_{n}_{k}_{d}_{constraint}.checkpoint.json")
+    telemetry.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    n, k, d, constraint = args.n, args.k, args.d, args.constraint
+    if not 0 < n <= MAX_PACKED_LENGTH:
+        parser.error(f"n must be between 1 and {MAX_PACKED_LENGTH}")
+    weights = args.weights if args.weights is not None else default_weights(n, d, constraint)
+    try:
+        check_weights(weights, constraint)
+    except ValueError as e:
+        parser.error(str(e))
+    seed = list(args.seed)
+    if args.seed_file:
+        seed = [int(w) for w in pack_vectors(load_basis(args.seed_file))] + seed
+    args.checkpoint = args.checkpoint.format(n=n, k=k, d=d, constraint=constraint)
+    run_telemetry, profiler = telemetry.from_args(args)
+
+    label = f"[{n},{k},{d}]" if constraint == "none" else f"{constraint.upper()} [{n},{k},{d}]"
+    print("=" * 70, flush=True)
+    print(f"GREEDY CONSTRUCTION OF {label} CODE", flush=True)
+    print("=" * 70, flush=True)
+    print(f"\nCandidate weights, in scan order: {weights}", flush=True)
+
+    parameters = {"n": n, "d": d, "constraint": constraint, "weights": list(weights)}
+    try:
+        with make_search(n, d, args.workers, telemetry=run_telemetry,
+                         checkpoint=checkpoint.from_args(args, parameters)) as search:
+            return _construct(args, search, weights, seed, label)
+    finally:
+        profiler.stop()
+        run_telemetry.close()
+
+def _construct(args, search, weights, seed, label):
+    """Resume or seed the search, then extend it to k vectors; returns main's exit status."""
+    n, k, constraint = args.n, args.k, args.constraint
+    basis = search.basis
+
+    if args.resume:
+        try:
+            search.restore(search.checkpoint.load(), constraint)
+        except (ValueError, KeyError) as e:
+            reason = f"checkpoint has no {e} entry" if isinstance(e, KeyError) else str(e)
+            print(f"✗ Cannot resume: {reason}", flush=True)
+            return 2
+        print(f"\n✓ Resumed from {args.checkpoint} with {len(basis)} basis vectors", flush=True)
+    else:
+        print("\n✓ Starting with all-zeros vector (implicit)", flush=True)
+        for word in seed:
+            reason = search.seed_violation(word, constraint)
+            if reason is not None:
+                print(f"✗ Seed vector {word:#x} is {reason}", flush=True)
+                return 2
+            search.accept(word)
+            print(f"✓ Added seed vector: weight = {bin(word).count('1')}", flush=True)
+
+    print(f"\nCurrent basis size: {len(basis)}", flush=True)
+    print(f"Current codebook size: {2**len(basis)} codewords", flush=True)
+
+    while len(basis) < k:
+        print("\n" + "=" * 70, flush=True)
+        print(f"SEARCHING for basis vector #{len(basis) + 1}...", flush=True)
+        print("=" * 70, flush=True)
+
+        start_time = time.time()
+        candidate, weight, attempts = search.find_next(weights, constraint_predicate(constraint, basis))
+
+        if candidate is not None:
+            search.accept(candidate)
+            elapsed = time.time() - start_time
+            positions = word_positions(candidate)
+            print(f"\n✓ FOUND basis vector #{len(basis)} after {attempts} candidates!", flush=True)
+            print(f"  Positions with 1s: {positions[:10]}{'...' if len(positions) > 10 else ''}", flush=True)
+            print(f"  Weight: {weight}", flush=True)
+            print(f"  Search time: {elapsed:.2f}s", flush=True)
+            print(f"\n✓ Current basis size: {len(basis)}", flush=True)
+            print(f"✓ Current codebook size: {2**len(basis)} codewords", flush=True)
+        else:
+            print(f"\n✗ No suitable vector among all {attempts} candidates", flush=True)
+            break
+
+    print("\n" + "=" * 70, flush=True)
+    print("FINAL STATUS", flush=True)
+    print("=" * 70, flush=True)
+    print(f"Basis size: {len(basis)}/{k}", flush=True)
+    print(f"Codebook size: {2**len(basis)}/{2**k}", flush=True)
+
+    complete = len(basis) == k
+    if complete:
+        print(f"\n🎉 Found all {k} basis vectors!", flush=True)
+        G = unpack_words(basis, n)
+        if CONSTRAINTS[constraint][1]:
+            rows = pack_rows(G)
+            if is_self_dual(rows, n):
+                print("✨ CONFIRMED: The code IS self-dual!", flush=True)
+            elif is_self_orthogonal(rows):
+                print("✓ CONFIRMED: The code is self-orthogonal", flush=True)
+            else:
+                print("⚠️  WARNING: Self-orthogonality check failed!", flush=True)
+        if args.output:
+            print(f"\nSaving basis to {args.output}...", flush=True)
+            save_basis(args.output, G, args.title or f"Greedy {label} code")
+            print("✓ Saved!", flush=True)
+    else:
+        print(f"\n⚠️  Only found {len(basis)} basis vectors so far.", flush=True)
+
+    return 0 if complete else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import numpy as np
+import time
+from itertools import combinations, islice
+from codebook import load_basis, popcount
+from gf2 import pack_rows, to_ints, rref, permute_columns
+
+def row_weights(rows):
+    """Hamming weight of every packed uint64 row."""
+    rows = np.ascontiguousarray(rows, dtype=np.uint64)
+    return popcount(rows.view(np.uint32)).reshape(len(rows), -1).sum(axis=1)
+
+def information_sets(rows, n):
+    """Generator matrices that are systematic on disjoint information sets.
+
+    Each matrix is reduced with the columns not yet used by an earlier
+    information set taken first.  Returns a list of (rows, rank) pairs,
+    rows in the original column order and rank the size of that matrix's
+    information set; the last ranks may fall short of k once too few
+    unused columns remain.
+    """
+    used = []
+    matrices = []
+    while len(used) < n:
+        used_set = set(used)
+        unused = [c for c in range(n) if c not in used_set]
+        order = unused + used
+        reduced, pivots = rref(permute_columns(rows, order, n), n)
+        info_set = [order[p] for p in pivots if p < len(unused)]
+        if not info_set:
+            break
+        restore = np.argsort(order)
+        matrices.append((permute_columns(reduced, restore, n), len(info_set)))
+        used += info_set
+    return matrices
+
+def _combination_words(rows, w, chunk_size=1 << 15):
+    """XORs of every w-subset of rows, a chunk at a time."""
+    subsets = combinations(range(len(rows)), w)
+    while True:
+        block = list(islice(subsets, chunk_size))
+        if not block:
+            return
+        yield np.bitwise_xor.reduce(rows[np.array(block, dtype=np.intp)], axis=1)
+
+def minimum_distance(rows, n):
+    """Brouwer–Zimmermann minimum distance of the code spanned by packed GF(2) rows.
+
+    The code is put in systematic form on several disjoint information
+    sets.  Step w XORs every w-subset of rows of each of those matrices.
+    A codeword not met by step w has at least w+1 nonzero message bits on
+    every information set, i.e. at least max(0, w+1 - (k - rank)) ones on
+    each set, which gives the lower bound; the lightest word met so far is
+    the upper bound.  Stops as soon as the bounds meet.
+
+    Returns a dict with the minimum distance, the minimum-weight codewords
+    met along the way (as ints, bit j = coordinate j; not necessarily all
+    of them), the number of codewords enumerated and the number of
+    information sets used.
+    """
+    matrices = information_sets(rows, n)
+    k = len(matrices[0][0]) if matrices else 0
+    if k == 0:
+        return {"min_distance": 0, "codewords": [], "enumerated": 0, "information_sets": 0}
+
+    upper = n + 1
+    found = set()
+    enumerated = 0
+    lower = 0
+    for w in range(1, k + 1):
+        for matrix, _ in matrices:
+            for words in _combination_words(matrix, w):
+                enumerated += len(words)
+                weights = row_weights(words)
+                lightest = int(weights.min())
+                if lightest < upper:
+                    upper = lightest
+                    found = set()
+                if lightest == upper:
+                    found.update(to_ints(words[weights == upper]))
+        lower = sum(max(0, w + 1 - (k - rank)) for _, rank in matrices)
+        if lower >= upper:
+            break
+    return {
+        "min_distance": upper,
+        "codewords": sorted(found),
+        "enumerated": enumerated,
+        "information_sets": len(matrices),
+    }
+
+def minimum_distance_from_file(filename):
+    """minimum_distance for the code in a basis file (any length)."""
+    basis = load_basis(filename)
+    return minimum_distance(pack_rows(basis), basis.shape[1])
+
+def extended_qr_rows(p):
+    """Generator rows of the extended quadratic-residue code of prime length p + 1.
+
+    Spans the cyclic shifts of sum of x^r over the nonresidues r, which for
+    p = 7 mod 8 generates the [p, (p+1)/2] QR code, then appends a parity bit.
+    """
+    residues = {(x * x) % p for x in range(1, p)}
+    idempotent = np.array([1 if r and r not in residues else 0 for r in range(p)])
+    shifts = np.array([np.roll(idempotent, s) for s in range(p)])
+    extended = np.hstack([shifts, shifts.sum(axis=1, keepdims=True) % 2])
+    reduced, _ = rref(pack_rows(extended), p + 1)
+    return reduced
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("MINIMUM DISTANCE WITHOUT ENUMERATING THE CODEBOOK")
+    print("=" * 70)
+
+    codes = []
+    for filename in ['golay_self_dual_basis.txt', 'golay_perfect_23_basis.txt',
+                     'golay_basis.txt']:
+        basis = load_basis(filename)
+        codes.append((filename, pack_rows(basis), basis.shape[1]))
+    for p in (47, 71):
+        rows = extended_qr_rows(p)
+        codes.append((f"extended QR code, length {p + 1}", rows, p + 1))
+
+    for name, rows, n in codes:
+        start_time = time.time()
+        result = minimum_distance(rows, n)
+        elapsed = time.time() - start_time
+        print(f"\n{name}:")
+        print(f"  • [{n},{len(rows)},{result['min_distance']}] "
+              f"using {result['information_sets']} information sets")
+        print(f"  • Enumerated {result['enumerated']:,} codewords "
+              f"(of 2^{len(rows)}) in {elapsed:.2f}s")
+        print(f"  • Minimum-weight codewords found: {len(result['codewords'])}")
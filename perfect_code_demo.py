@@ -1,24 +1,7 @@
 import numpy as np
 from math import comb
-
-def hamming_weight(v):
-    """Calculate Hamming weight (number of 1s) of a binary vector."""
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    """Generate all 2^k linear combinations of k basis vectors."""
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
+from codebook import pack_vectors, generate_codewords, weight_distribution
+from perfect_check import sphere_coverage
 
 print("=" * 70)
 print("PERFECT CODE DEMONSTRATION")
@@ -43,12 +26,11 @@ print(f"✓ Created 23-bit basis with {len(basis_23)} vectors")
 
 # Generate all 23-bit codewords
 print("\n🔄 Generating all codewords...")
-codewords_23 = generate_all_linear_combinations(basis_23)
+codewords_23 = generate_codewords(pack_vectors(basis_23))
 print(f"✓ Generated {len(codewords_23)} codewords")
 
 # Check minimum distance
-weights = [hamming_weight(cw) for cw in codewords_23[1:]]  # Skip all-zeros
-min_dist = min(weights)
+_, min_dist = weight_distribution(codewords_23, 23)
 print(f"✓ Minimum distance: {min_dist}")
 
 print("\n" + "=" * 70)
@@ -92,9 +74,17 @@ print(f"\n4. Coverage by spheres:")
 print(f"     {num_codewords:,} codewords × {sphere_size:,} points/sphere")
 print(f"     = {num_codewords * sphere_size:,}")
 
+# Matching totals are necessary but not sufficient: mark every sphere in a
+# 2^23-bit bitmap to see whether they really cover the space without overlap
+result = sphere_coverage(codewords_23, n, t)
+print(f"\n5. Exhaustive check of the punctured code's spheres:")
+print(f"     • Vectors covered: {result['covered']:,} / {result['vectors']:,}")
+print(f"     • Overlapping hits: {result['overlaps']:,}")
+print(f"     • Covering radius: {result['covering_radius']}")
+
 print("\n" + "=" * 70)
 
-if num_codewords * sphere_size == total_space:
+if result['perfect']:
     print("✨ PERFECT! ✨")
     print()
     print("The Hamming spheres EXACTLY partition the 23-dimensional hypercube!")
@@ -107,46 +97,28 @@ if num_codewords * sphere_size == total_space:
     print("  • NO overlaps between spheres")
     print("  • Theoretically optimal error correction!")
 else:
-    ratio = (num_codewords * sphere_size) / total_space
-    print(f"Not perfect. Coverage ratio: {ratio:.4f}")
-    if ratio < 1:
-        print("(Spheres don't cover the whole space)")
-    else:
-        print("(Spheres overlap)")
+    print("Not perfect, even though the sphere sizes add up!")
+    if result['covered'] < total_space:
+        print(f"({total_space - result['covered']:,} vectors lie outside every sphere)")
+    if result['overlaps']:
+        print(f"({result['overlaps']:,} sphere points overlap another sphere)")
 
 print("\n" + "=" * 70)
-print("COMPARISON: Extended [24,12,8] vs Binary [23,12,7]")
+print("COMPARISON: THE 24-BIT CODE VS ITS PUNCTURED 23-BIT CODE")
 print("=" * 70)
 
-# Check 24-bit version
-n_ext = 24
-k_ext = 12
-d_ext = 8
-t_ext = (d_ext - 1) // 2
-
-num_codewords_ext = 2**k_ext
-sphere_size_ext = sum(comb(n_ext, i) for i in range(t_ext + 1))
-total_space_ext = 2**n_ext
-coverage_ext = num_codewords_ext * sphere_size_ext
-
-print(f"""
-Extended Binary Golay Code [24,12,8]:
-  • Codewords: {num_codewords_ext:,}
-  • Sphere size (radius {t_ext}): {sphere_size_ext:,}
-  • Total space: {total_space_ext:,}
-  • Coverage: {coverage_ext:,}
-  • Perfect? {coverage_ext == total_space_ext}
-  • Coverage ratio: {coverage_ext/total_space_ext:.4f}
-
-Binary Golay Code [23,12,7]:
-  • Codewords: {num_codewords:,}
-  • Sphere size (radius {t}): {sphere_size:,}
-  • Total space: {total_space:,}
-  • Coverage: {num_codewords * sphere_size:,}
-  • Perfect? {num_codewords * sphere_size == total_space} ✨
-  • Coverage ratio: {(num_codewords * sphere_size)/total_space:.4f}
-""")
-
-print("The 24-bit extended version has DOUBLE coverage - the spheres overlap!")
-print("Puncturing one bit gives us the perfect 23-bit code.")
-
+# Measure both codes as loaded: their actual minimum distances, and how
+# the radius-t spheres around their codewords really cover the space
+codes = [("24-bit code from golay_basis.txt", generate_codewords(pack_vectors(basis_24)), 24),
+         ("Punctured 23-bit code", codewords_23, 23)]
+for label, codewords, length in codes:
+    _, code_d = weight_distribution(codewords, length)
+    code_t = (code_d - 1) // 2
+    coverage = sphere_coverage(codewords, length, code_t)
+    print(f"\n{label} [{length},{k},{code_d}]:")
+    print(f"  • Codewords: {len(codewords):,}")
+    print(f"  • Sphere radius t: {code_t}")
+    print(f"  • Vectors covered: {coverage['covered']:,} / {coverage['vectors']:,}")
+    print(f"  • Overlapping hits: {coverage['overlaps']:,}")
+    print(f"  • Covering radius: {coverage['covering_radius']}")
+    print(f"  • Perfect? {coverage['perfect']}")
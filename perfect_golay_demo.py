@@ -1,41 +1,21 @@
-import numpy as np
 from math import comb
-from collections import Counter
-
-def hamming_weight(v):
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
+from codebook import weight_distribution
+from code_cache import load_code
+from perfect_check import sphere_coverage
+from simulate import simulate_curve
 
 print("=" * 70)
 print("THE PERFECT BINARY GOLAY CODE [23,12,7]")
 print("=" * 70)
 
 # Load the punctured code (from self-dual construction)
-basis = []
-with open('golay_perfect_23_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis.append(vec)
+code = load_code('golay_perfect_23_basis.txt')
 
-print(f"\n✓ Loaded basis with {len(basis)} vectors")
+print(f"\n✓ Loaded basis with {code.k} vectors")
 
 # Generate all codewords
 print("✓ Generating all codewords...")
-codewords = generate_all_linear_combinations(basis)
+codewords = code.codewords
 print(f"✓ Generated {len(codewords):,} codewords")
 
 # Parameters
@@ -57,8 +37,8 @@ print(f"""
 """)
 
 # Weight distribution
-weights = [hamming_weight(cw) for cw in codewords]
-weight_dist = Counter(weights)
+distribution, _ = weight_distribution(codewords, n)
+weight_dist = {w: int(count) for w, count in enumerate(distribution) if count}
 
 print("=" * 70)
 print("WEIGHT DISTRIBUTION")
@@ -97,7 +77,15 @@ print()
 print("  Total 23-bit vectors:       ", f"{total_space:,}".rjust(15))
 print()
 
-if coverage == total_space:
+# Equal totals only allow a tiling; mark every sphere to prove there is one
+result = sphere_coverage(codewords, n, t)
+print("  Exhaustive check (every sphere marked in a 2^23-bit bitmap):")
+print("    • Vectors covered:        ", f"{result['covered']:,}".rjust(15))
+print("    • Overlapping hits:       ", f"{result['overlaps']:,}".rjust(15))
+print("    • Covering radius:        ", f"{result['covering_radius']}".rjust(15))
+print()
+
+if result['perfect']:
     print("  " + "═" * 50)
     print("  ✨ PERFECT MATCH! ✨")
     print("  " + "═" * 50)
@@ -109,6 +97,24 @@ if coverage == total_space:
     print("  Every possible 23-bit vector is within distance 3 of")
     print("  EXACTLY ONE codeword - no more, no less!")
 
+print("\n" + "=" * 70)
+print("MEASURED ERROR CORRECTION")
+print("=" * 70)
+
+print("""
+Monte Carlo over a binary symmetric channel with crossover probability p.
+A perfect code decodes wrongly exactly when more than t bits flip, so the
+measured frame error rate can be checked against the binomial tail:
+""")
+
+for result in simulate_curve('golay_perfect_23_basis.txt', "bsc", [0.01, 0.02, 0.05]):
+    p = result["parameter"]
+    exact = 1 - sum(comb(n, i) * p**i * (1 - p)**(n - i) for i in range(t + 1))
+    low, high = result["fer_interval"]
+    inside = "✓" if low <= exact <= high else "✗"
+    print(f"  {inside} p = {p:.2f}: FER {result['fer']:.3e} over {result['frames']:,} frames "
+          f"(95% CI {low:.2e}-{high:.2e}), exact {exact:.3e}")
+
 print("\n" + "=" * 70)
 print("PRACTICAL IMPLICATIONS")
 print("=" * 70)
@@ -0,0 +1,222 @@
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor
+from statistics import NormalDist
+from codebook import pack_vectors, popcount
+from code_cache import load_code
+from soft_decoder import SoftDecoder, bpsk_llrs
+import telemetry
+
+# Each channel point (BSC crossover probability, or Eb/N0 in dB for BPSK
+# over AWGN) is simulated in batches of random frames.  Every batch gets
+# its own child of the point's SeedSequence and results are accumulated
+# in submission order, so a run is reproducible whatever the number of
+# workers.  A point stops once the confidence interval of its frame error
+# rate is within the requested relative precision (frame errors are
+# independent; bit errors within a frame are not, so the BER is reported
+# without an interval).
+
+BATCH_FRAMES = 1 << 16
+DEFAULT_BASIS = 'golay_self_dual_basis.txt'
+
+class Simulator:
+    """Encoder, channel and decoder for one code, run a batch of frames at a time."""
+
+    def __init__(self, basis_file):
+        code = load_code(basis_file)
+        self.n = code.n
+        self.k = code.k
+        self.encoder = code.encoder()
+        self.hard = code.decoder()
+        self._soft = None
+
+    @property
+    def soft(self):
+        if self._soft is None:
+            self._soft = SoftDecoder(self.hard.basis_words, self.n)
+        return self._soft
+
+    def run_batch(self, channel, parameter, decoder, frames, seed):
+        """(frame errors, message bit errors) for a batch of random frames."""
+        rng = np.random.default_rng(seed)
+        messages = rng.integers(0, 1 << self.k, frames, dtype=np.uint32)
+        codewords = self.encoder.encode(messages)
+        if channel == "bsc":
+            flips = rng.random((frames, self.n), dtype=np.float32) < parameter
+            decoded, _ = self.hard.decode(codewords ^ pack_vectors(flips))
+        elif decoder == "soft":
+            decoded, _ = self.soft.decode(bpsk_llrs(codewords, self.n, parameter, self.k / self.n, rng))
+        else:
+            llrs = bpsk_llrs(codewords, self.n, parameter, self.k / self.n, rng)
+            decoded, _ = self.hard.decode(pack_vectors(llrs < 0))
+        # Uncorrectable words come back as received; their message bits pass through
+        wrong = self.hard.messages(decoded) ^ messages
+        return int(np.count_nonzero(wrong)), int(popcount(wrong).sum(dtype=np.int64))
+
+def wilson_interval(errors, trials, confidence=0.95):
+    """Wilson score interval for an error probability."""
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    rate = errors / trials
+    center = (rate + z * z / (2 * trials)) / (1 + z * z / trials)
+    half = z * np.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / (1 + z * z / trials)
+    return max(0.0, center - half), min(1.0, center + half)
+
+_worker_simulator = None
+
+def _init_worker(basis_file):
+    """Pool initializer: load the code tables once per worker process."""
+    global _worker_simulator
+    _worker_simulator = Simulator(basis_file)
+
+def _run_batch(channel, parameter, decoder, frames, seed):
+    return _worker_simulator.run_batch(channel, parameter, decoder, frames, seed)
+
+class _Inline:
+    """Stand-in for a process pool that runs each batch when it is submitted."""
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+    def shutdown(self, **kwargs):
+        pass
+
+def simulate_curve(basis_file, channel, parameters, decoder="hard", precision=0.1,
+                   confidence=0.95, min_errors=100, max_frames=10 ** 8,
+                   batch_frames=BATCH_FRAMES, seed=0, workers=1, run_telemetry=None):
+    """Simulate each channel point in turn, yielding one result dict per point.
+
+    A point stops when it has min_errors frame errors and the half-width
+    of its FER confidence interval is at most precision * FER, or after
+    max_frames frames.  With workers > 1, batches run on a process pool
+    with up to two batches per worker in flight; batches still running
+    when a point stops are discarded.
+    """
+    if channel not in ("bsc", "awgn"):
+        raise ValueError(f"Unknown channel {channel!r}")
+    if max_frames < 1 or batch_frames < 1:
+        raise ValueError("max_frames and batch_frames must be at least 1")
+    if run_telemetry is None:
+        run_telemetry = telemetry.Telemetry()
+    k = load_code(basis_file).k
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                   initargs=(basis_file,))
+        in_flight = 2 * workers
+    else:
+        _init_worker(basis_file)
+        pool = _Inline()
+        in_flight = 1
+
+    try:
+        for parameter, point_seed in zip(parameters, np.random.SeedSequence(seed).spawn(len(parameters))):
+            start_time = time.time()
+            frames = frame_errors = bit_errors = 0
+            submitted = 0
+            pending = []
+            converged = False
+            while True:
+                while len(pending) < in_flight and submitted < max_frames:
+                    size = min(batch_frames, max_frames - submitted)
+                    pending.append((size, pool.submit(_run_batch, channel, parameter, decoder,
+                                                      size, point_seed.spawn(1)[0])))
+                    submitted += size
+                if not pending:
+                    break
+                size, future = pending.pop(0)
+                errors, bits = future.result()
+                frames += size
+                frame_errors += errors
+                bit_errors += bits
+                run_telemetry.count("frames", size)
+                low, high = wilson_interval(frame_errors, frames, confidence)
+                if frame_errors >= min_errors and (high - low) / 2 <= precision * frame_errors / frames:
+                    converged = True
+                    break
+            for _, future in pending:
+                future.cancel()
+
+            result = {
+                "channel": channel,
+                "parameter": parameter,
+                "decoder": "hard" if channel == "bsc" else decoder,
+                "frames": frames,
+                "frame_errors": frame_errors,
+                "bit_errors": bit_errors,
+                "fer": frame_errors / frames,
+                "fer_interval": [low, high],
+                "ber": bit_errors / (frames * k),
+                "converged": converged,
+                "seconds": time.time() - start_time,
+            }
+            run_telemetry.event("point", **result)
+            yield result
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo bit and frame error rates of a code.")
+    parser.add_argument("points", type=float, nargs="+",
+                        help="BSC crossover probabilities, or Eb/N0 values in dB for AWGN")
+    parser.add_argument("--basis", default=DEFAULT_BASIS,
+                        help=f"basis file of the code (default: {DEFAULT_BASIS})")
+    parser.add_argument("--channel", choices=["bsc", "awgn"], default="awgn",
+                        help="binary symmetric channel, or BPSK over AWGN (default: awgn)")
+    parser.add_argument("--decoder", choices=["hard", "soft"], default="hard",
+                        help="AWGN decoding: syndrome decoding of hard decisions, "
+                             "or ML soft decoding (default: hard)")
+    parser.add_argument("--precision", type=float, default=0.1,
+                        help="stop when the FER interval half-width is this fraction of the FER "
+                             "(default: 0.1)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="confidence level of the FER interval (default: 0.95)")
+    parser.add_argument("--min-errors", type=int, default=100,
+                        help="frame errors needed before a point may stop (default: 100)")
+    parser.add_argument("--max-frames", type=float, default=1e8,
+                        help="frames after which a point stops regardless (default: 1e8)")
+    parser.add_argument("--batch-frames", type=int, default=BATCH_FRAMES,
+                        help=f"frames per batch (default: {BATCH_FRAMES})")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="simulate batches in this many processes (default: 1)")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON to PATH")
+    telemetry.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.max_frames < 1:
+        parser.error("--max-frames must be at least 1")
+    if args.batch_frames < 1:
+        parser.error("--batch-frames must be at least 1")
+    run_telemetry, profiler = telemetry.from_args(args)
+
+    unit = "p" if args.channel == "bsc" else "Eb/N0 (dB)"
+    print("=" * 70)
+    print(f"SIMULATING {args.basis} OVER {args.channel.upper()}"
+          + (f" ({args.decoder} decoding)" if args.channel == "awgn" else ""))
+    print("=" * 70)
+    print(f"\n  {unit:>10s}  {'frames':>13s}  {'errors':>9s}  {'FER':>10s}  {'BER':>10s}  {'time':>7s}")
+
+    results = []
+    for result in simulate_curve(args.basis, args.channel, args.points, args.decoder,
+                                 args.precision, args.confidence, args.min_errors,
+                                 int(args.max_frames), args.batch_frames, args.seed,
+                                 args.workers, run_telemetry):
+        results.append(result)
+        mark = "✓" if result["converged"] else "…"
+        print(f"{mark} {result['parameter']:10g}  {result['frames']:13,}  {result['frame_errors']:9,}  "
+              f"{result['fer']:10.3e}  {result['ber']:10.3e}  {result['seconds']:6.1f}s", flush=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"basis": args.basis, "seed": args.seed, "points": results}, f, indent=2)
+        print(f"\n✓ Saved {len(results)} points to {args.output}")
+    profiler.stop()
+    run_telemetry.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+import numpy as np
+from codebook import load_basis, pack_vectors, generate_codewords, linear_map_tables, apply_linear_map
+
+FULL_TABLE_BITS = 16  # up to this many message bits, one table holds every codeword
+SPLIT_TABLE_BITS = 8  # longer messages are split into chunks of this many bits
+
+class TableEncoder:
+    """Encoder compiled from a basis into lookup tables of packed codewords.
+
+    With one table (every codeword, in message order) encoding a whole
+    array of messages is a single gather.  With chunk_bits set below k the
+    message is split into chunk_bits-bit pieces, one table each, and the
+    gathered pieces are XORed; chunk_bits=6 gives the two 64-entry tables
+    for a 12-bit message.  Messages are packed ints, bit j selecting basis
+    row j, exactly as in generate_codewords.
+    """
+
+    def __init__(self, basis_words, n, chunk_bits=None, table=None):
+        basis_words = np.asarray(basis_words, dtype=np.uint32).ravel()
+        self.n = n
+        self.k = len(basis_words)
+        if chunk_bits is None:
+            chunk_bits = self.k if self.k <= FULL_TABLE_BITS else SPLIT_TABLE_BITS
+        if chunk_bits >= self.k:
+            self.tables = np.asarray(table if table is not None
+                                     else generate_codewords(basis_words))[None, :]
+        else:
+            self.tables = linear_map_tables(basis_words, chunk_bits)
+
+    @classmethod
+    def from_file(cls, basis_file, chunk_bits=None):
+        """Encoder for the code in a basis file."""
+        basis = load_basis(basis_file)
+        return cls(pack_vectors(basis), basis.shape[1], chunk_bits)
+
+    def encode(self, messages, out=None):
+        """Packed codewords for an array of packed messages."""
+        messages = np.asarray(messages, dtype=np.uint32)
+        if len(self.tables) == 1:
+            return np.take(self.tables[0], messages, out=out)
+        codewords = apply_linear_map(self.tables, messages)
+        if out is None:
+            return codewords
+        out[...] = codewords
+        return out
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("LOOKUP-TABLE BATCH ENCODER")
+    print("=" * 70)
+
+    basis = load_basis('golay_self_dual_basis.txt')
+    words = pack_vectors(basis)
+    messages = np.random.default_rng(0).integers(0, 1 << len(words), 1 << 24, dtype=np.uint32)
+    expected = None
+    for label, chunk_bits in [("one 4096-entry table", None), ("two 64-entry tables", 6),
+                              ("three 16-entry tables", 4)]:
+        encoder = TableEncoder(words, basis.shape[1], chunk_bits)
+        encoder.encode(messages[:1024])
+        start_time = time.perf_counter()
+        codewords = encoder.encode(messages)
+        elapsed = time.perf_counter() - start_time
+        if expected is None:
+            expected = codewords
+        print(f"\n{label}:")
+        print(f"  • {len(messages) / elapsed / 1e6:.1f}M messages/s "
+              f"({8 * len(messages) / elapsed / 1e9:.2f} GB/s in + out)")
+        print(f"  • Matches: {np.array_equal(codewords, expected)}")
@@ -0,0 +1,148 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Long-running searches report to a Telemetry object instead of printing
+# progress.  Counters accumulate (attempts, rejections per constraint,
+# search nodes), stages accumulate wall time, and events are written as
+# JSON lines or mirrored into a Prometheus textfile-exporter file.  With
+# no path everything is still counted but nothing is written.
+
+class Telemetry:
+    """Counters, stage timers and structured events for one run."""
+
+    def __init__(self, path=None, format="jsonl", prefix="golay"):
+        if format not in ("jsonl", "prom"):
+            raise ValueError(f"Unknown telemetry format {format!r}")
+        self.path = path
+        self.format = format
+        self.prefix = prefix
+        self.counters = {}
+        self.stages = {}
+        self.start_time = time.time()
+        self._stream = None
+        if path is not None and format == "jsonl":
+            self._stream = sys.stdout if path == "-" else open(path, "a")
+
+    @property
+    def enabled(self):
+        return self.path is not None
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def rate(self, name):
+        """Counter per second of run time."""
+        elapsed = time.time() - self.start_time
+        return self.counters.get(name, 0) / elapsed if elapsed > 0 else 0.0
+
+    def event(self, name, **fields):
+        """Write one event (JSON line, or a refreshed textfile export)."""
+        if not self.enabled:
+            return
+        if self._stream is not None:
+            record = {"time": time.time(), "elapsed": time.time() - self.start_time,
+                      "event": name, **fields}
+            self._stream.write(json.dumps(record) + "\n")
+            self._stream.flush()
+        else:
+            self.export()
+
+    @contextmanager
+    def stage(self, name, **fields):
+        """Time a block, adding its wall time to the stage total."""
+        start_time = time.time()
+        try:
+            yield
+        finally:
+            seconds = time.time() - start_time
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+            self.event("stage", stage=name, seconds=seconds, **fields)
+
+    def export(self):
+        """Write counters and stage times in Prometheus textfile format (atomically)."""
+        lines = [f"# TYPE {self.prefix}_uptime_seconds gauge",
+                 f"{self.prefix}_uptime_seconds {time.time() - self.start_time:.6f}"]
+        for name, value in sorted(self.counters.items()):
+            lines += [f"# TYPE {self.prefix}_{name}_total counter",
+                      f"{self.prefix}_{name}_total {value}"]
+        if self.stages:
+            lines.append(f"# TYPE {self.prefix}_stage_seconds_total counter")
+            for name, seconds in sorted(self.stages.items()):
+                lines.append(f'{self.prefix}_stage_seconds_total{{stage="{name}"}} {seconds:.6f}')
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        """Emit a summary of every counter and stage, then release the output."""
+        self.event("summary", seconds=time.time() - self.start_time,
+                   counters=self.counters, stages=self.stages)
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        self._stream = None
+
+class Profiler:
+    """cProfile plus tracemalloc around a run; the report is written on stop().
+
+    PATH gets a text report (cumulative-time hot spots, then peak memory
+    and the top allocation sites) and PATH.prof the raw cProfile data.
+    A Profiler with no path does nothing.
+    """
+
+    def __init__(self, path=None, top=25):
+        self.path = path
+        self.top = top
+        self._profile = None
+
+    def start(self):
+        if self.path is None:
+            return self
+        tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        return self
+
+    def stop(self):
+        if self._profile is None:
+            return
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        report = io.StringIO()
+        pstats.Stats(self._profile, stream=report).sort_stats("cumulative").print_stats(self.top)
+        report.write(f"Peak traced memory: {peak / 1e6:.2f} MB\n\nTop allocation sites:\n")
+        for stat in snapshot.statistics("lineno")[:self.top]:
+            report.write(f"  {stat}\n")
+        with open(self.path, "w") as f:
+            f.write(report.getvalue())
+        self._profile.dump_stats(f"{self.path}.prof")
+        self._profile = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def add_arguments(parser):
+    """Add --telemetry, --telemetry-format and --profile to an argparse parser."""
+    parser.add_argument("--telemetry", metavar="PATH",
+                        help="write progress events to PATH ('-' for stdout)")
+    parser.add_argument("--telemetry-format", choices=["jsonl", "prom"], default="jsonl",
+                        help="JSON lines, or a Prometheus textfile-exporter file (default: jsonl)")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="profile the run with cProfile and tracemalloc, report to PATH")
+
+def from_args(args):
+    """(Telemetry, started Profiler) for parsed command-line arguments."""
+    return Telemetry(args.telemetry, args.telemetry_format), Profiler(args.profile).start()
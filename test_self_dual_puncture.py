@@ -1,37 +1,16 @@
-import numpy as np
-from collections import Counter
 from math import comb
-
-def hamming_weight(v):
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
+from codebook import unpack_words
+from code_cache import load_code
+from puncture_analysis import puncture_table, puncture_words
 
 print("=" * 70)
 print("TESTING PUNCTURE OF SELF-DUAL [24,12,8] CODE")
 print("=" * 70)
 
 # Load the self-dual basis
-basis_24 = []
-with open('golay_self_dual_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_24.append(vec)
+code_24 = load_code('golay_self_dual_basis.txt')
 
-print(f"\n✓ Loaded self-dual basis with {len(basis_24)} vectors")
+print(f"\n✓ Loaded self-dual basis with {code_24.k} vectors")
 
 # Try puncturing at different positions
 print("\n" + "=" * 70)
@@ -41,24 +20,12 @@ print("=" * 70)
 best_min_dist = 0
 best_position = -1
 
-for pos in range(24):
-    basis_punctured = [vec[:pos].tolist() + vec[pos+1:].tolist() for vec in basis_24]
-    basis_punctured = [np.array(v, dtype=int) for v in basis_punctured]
-    
-    codewords = generate_all_linear_combinations(basis_punctured)
-    
-    # Check for duplicates
-    unique_codewords = []
-    seen = set()
-    for cw in codewords:
-        cw_tuple = tuple(cw)
-        if cw_tuple not in seen:
-            seen.add(cw_tuple)
-            unique_codewords.append(cw)
-    
-    # Find minimum distance
-    weights = [hamming_weight(cw) for cw in unique_codewords[1:]]
-    min_dist = min(weights) if weights else 0
+# Every punctured code's parameters from one pass over the 24-bit codebook
+table = puncture_table(code_24.codewords, code_24.n)
+
+for pos in range(code_24.n):
+    num_unique = 1 << int(table["punctured_k"][pos])
+    min_dist = int(table["punctured_d"][pos])
     
     marker = ""
     if min_dist >= best_min_dist:
@@ -67,7 +34,7 @@ for pos in range(24):
         if min_dist == 7:
             marker = " ✨ PERFECT!"
     
-    print(f"Position {pos:2d}: {len(unique_codewords):4d} unique codewords, min_dist = {min_dist}{marker}")
+    print(f"Position {pos:2d}: {num_unique:4d} unique codewords, min_dist = {min_dist}{marker}")
 
 print("\n" + "=" * 70)
 print(f"Best puncturing position: {best_position} (min_dist = {best_min_dist})")
@@ -77,10 +44,8 @@ if best_min_dist == 7:
     print("\n🎉 SUCCESS! We can puncture to get [23,12,7]!")
     
     # Generate the perfect code
-    basis_23 = [vec[:best_position].tolist() + vec[best_position+1:].tolist() for vec in basis_24]
-    basis_23 = [np.array(v, dtype=int) for v in basis_23]
-    
-    codewords_23 = generate_all_linear_combinations(basis_23)
+    basis_23 = unpack_words(puncture_words(code_24.basis, best_position), code_24.n - 1)
+    codewords_23 = puncture_words(code_24.codewords, best_position)
     
     # Perfect code check
     n = 23
@@ -0,0 +1,35 @@
+import json
+import pytest
+import greedy_engine
+from greedy_engine import GreedySearch
+
+def saved_run(tmp_path, *options):
+    path = tmp_path / "search.checkpoint.json"
+    assert greedy_engine.main(["12", "4", "4", "--checkpoint", str(path), *options]) == 0
+    return path
+
+def test_resume_continues_a_saved_search(tmp_path):
+    path = saved_run(tmp_path)
+    assert greedy_engine.main(["12", "5", "4", "--checkpoint", str(path), "--resume"]) == 0
+    assert len(json.loads(path.read_text())["basis"]) == 5
+
+def test_resume_rejects_a_tampered_basis(tmp_path, capsys):
+    path = saved_run(tmp_path)
+    state = json.loads(path.read_text())
+    state["basis"].append(1)  # weight 1, far below d = 4
+    path.write_text(json.dumps(state))
+    assert greedy_engine.main(["12", "5", "4", "--checkpoint", str(path), "--resume"]) == 2
+    assert "Cannot resume: Checkpoint basis vector 0x1" in capsys.readouterr().out
+
+@pytest.mark.parametrize("basis, constraint, reason", [
+    ([1], "none", "within distance 3"),
+    ([0], "none", "zero vector"),
+    ([1 << 12], "none", "not a length-12 vector"),
+    ([0b1111, 0b1111], "none", "within distance 3"),
+    ([0b11111], "even", "weight not divisible by 2"),
+    ([0b1111, 0b111000111], "self-orthogonal", "not orthogonal"),
+])
+def test_restore_checks_every_saved_vector(basis, constraint, reason):
+    search = GreedySearch(12, 4)
+    with pytest.raises(ValueError, match=reason):
+        search.restore({"n": 12, "d": 4, "basis": basis, "scan": None}, constraint)
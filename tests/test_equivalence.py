@@ -0,0 +1,35 @@
+from itertools import permutations
+import numpy as np
+import pytest
+from codebook import generate_codewords, permute_words, same_code
+from equivalence import EquivalenceSearch, find_equivalence
+from gf2 import from_ints, rank
+
+def random_basis(n, k, rng):
+    while True:
+        basis = rng.integers(1, 1 << n, k).astype(np.uint32)
+        if rank(from_ints(basis, n), n) == k:
+            return basis
+
+# Shapes whose lightest weight classes hold only a word or two, which used
+# to leave the backtracking search almost unconstrained
+@pytest.mark.parametrize("n, k, seed", [(17, 9, 0), (19, 5, 1), (11, 7, 2), (17, 3, 3),
+                                        (17, 8, 4), (19, 8, 5), (18, 4, 6), (16, 8, 7)])
+def test_finds_permutation_of_random_code(n, k, seed):
+    rng = np.random.default_rng(seed)
+    basis = random_basis(n, k, rng)
+    permuted = permute_words(basis, rng.permutation(n))
+    perm = find_equivalence(basis, permuted, n)
+    assert perm is not None
+    assert same_code(np.sort(generate_codewords(permuted)),
+                     permute_words(generate_codewords(basis), perm))
+
+def test_proves_inequivalent_codes_with_same_weights():
+    # Both [6,3] codes have weight distribution 1, 3x2, 3x4, 1x6, but no
+    # permutation maps one onto the other (checked here by brute force)
+    words_a = generate_codewords(np.array([0b011110, 0b010100, 0b101011], dtype=np.uint32))
+    words_b = generate_codewords(np.array([0b011110, 0b111111, 0b101110], dtype=np.uint32))
+    sorted_b = np.sort(words_b)
+    assert not any(same_code(sorted_b, permute_words(words_a, perm))
+                   for perm in permutations(range(6)))
+    assert EquivalenceSearch(words_a, words_b, 6).solve() is None
@@ -1,75 +1,50 @@
-import numpy as np
-from collections import Counter
 from math import comb
+from code_cache import load_code
+from puncture_analysis import puncture_table
 
-def hamming_weight(v):
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
-
-# Load 24-bit basis
-basis_24 = []
-with open('golay_basis.txt', 'r') as f:
-    for line in f:
-        if line.strip() and not line.startswith('#'):
-            vec = np.array([int(x) for x in line.split()], dtype=int)
-            basis_24.append(vec)
+# Load 24-bit code
+code_24 = load_code('golay_basis.txt')
 
 print("=" * 70)
 print("TRYING SHORTENING vs PUNCTURING")
 print("=" * 70)
 
 # Generate all 24-bit codewords
-codewords_24 = generate_all_linear_combinations(basis_24)
+codewords_24 = code_24.codewords
 print(f"\n✓ Generated {len(codewords_24)} codewords for [24,12,8] code")
 
+# Shortened code parameters for every position from one pass
+table = puncture_table(codewords_24, code_24.n)
+
 # Try shortening at position 0
 print("\nShortening at position 0:")
 print("  (keep only codewords with 0 in position 0, then remove that position)")
 
-shortened_codewords = []
-for cw in codewords_24:
-    if cw[0] == 0:  # Keep only if position 0 is 0
-        shortened_codewords.append(cw[1:])  # Remove position 0
+n = code_24.n - 1
+k = int(table["shortened_k"][0])
+min_dist = int(table["shortened_d"][0])
+num_shortened = 1 << k
 
-print(f"  • Result: {len(shortened_codewords)} codewords")
+print(f"  • Result: {num_shortened} codewords")
 
-if len(shortened_codewords) > 0:
-    # Find minimum distance
-    min_dist = float('inf')
-    for cw in shortened_codewords:
-        w = hamming_weight(cw)
-        if w > 0 and w < min_dist:
-            min_dist = w
-    
+if num_shortened > 0:
     print(f"  • Minimum distance: {min_dist}")
-    print(f"  • Code parameters: [{len(shortened_codewords[0])}, {int(np.log2(len(shortened_codewords)))}, {min_dist}]")
+    print(f"  • Code parameters: [{n}, {k}, {min_dist}]")
     
     # Check if perfect
-    n = len(shortened_codewords[0])
-    k = int(np.log2(len(shortened_codewords)))
     t = (min_dist - 1) // 2
     sphere_size = sum(comb(n, i) for i in range(t + 1))
-    coverage = len(shortened_codewords) * sphere_size
+    coverage = num_shortened * sphere_size
     total_space = 2**n
     
     print(f"\n  Perfect code check:")
-    print(f"    Spheres of radius {t}: {len(shortened_codewords)} × {sphere_size} = {coverage}")
+    print(f"    Spheres of radius {t}: {num_shortened} × {sphere_size} = {coverage}")
     print(f"    Total space: {total_space}")
     print(f"    Perfect? {coverage == total_space}")
 
+print("\nShortened minimum distance at every position:")
+print("  " + " ".join(f"{d}" for d in table["shortened_d"]))
+
 print("\n" + "=" * 70)
 print("INSIGHT: Shortening vs Puncturing")
 print("=" * 70)
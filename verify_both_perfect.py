@@ -1,22 +1,6 @@
-import numpy as np
 from math import comb
-
-def hamming_weight(v):
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
+from code_cache import load_code
+from perfect_check import sphere_coverage
 
 print("=" * 70)
 print("VERIFYING PERFECT CODE PROPERTY FOR BOTH 23-BIT CODES")
@@ -30,16 +14,8 @@ for code_name, filename in [
     print(f"Testing: {code_name}")
     print('=' * 70)
     
-    # Load basis
-    basis = []
-    with open(filename, 'r') as f:
-        for line in f:
-            if line.strip() and not line.startswith('#'):
-                vec = np.array([int(x) for x in line.split()], dtype=int)
-                basis.append(vec)
-    
-    # Generate codewords
-    codewords = generate_all_linear_combinations(basis)
+    # Load the code (codewords come from the binary cache after the first run)
+    codewords = load_code(filename).codewords
     
     # Check parameters
     n = 23
@@ -64,13 +40,22 @@ for code_name, filename in [
     print(f"  • Total space: {total_space:,}")
     print(f"  • Coverage: {coverage:,}")
     
-    is_perfect = (coverage == total_space)
+    # The count above only says the balls COULD tile the space; marking
+    # every ball in a 2^23-bit bitmap shows whether they actually do
+    result = sphere_coverage(codewords, n, t)
+    print(f"\nExhaustive sphere check:")
+    print(f"  • Vectors covered: {result['covered']:,} / {result['vectors']:,}")
+    print(f"  • Overlapping hits: {result['overlaps']:,}")
+    print(f"  • Covering radius: {result['covering_radius']}")
+    
+    is_perfect = result['perfect']
     print(f"\n  → Perfect? {is_perfect}")
     
     if is_perfect:
         print("  ✨ YES! This is a perfect code.")
     else:
-        print(f"  ✗ NO. Coverage ratio: {coverage / total_space:.6f}")
+        print(f"  ✗ NO. {total_space - result['covered']:,} vectors uncovered, "
+              f"{result['overlaps']:,} overlapping hits")
 
 print("\n" + "=" * 70)
 print("CONCLUSION")
@@ -1,24 +1,6 @@
 import numpy as np
-from collections import Counter
-
-def hamming_weight(v):
-    """Calculate Hamming weight (number of 1s) of a binary vector."""
-    return np.sum(v)
-
-def generate_all_linear_combinations(basis_vectors):
-    """Generate all 2^k linear combinations of k basis vectors."""
-    k = len(basis_vectors)
-    n = len(basis_vectors[0])
-    codewords = []
-    
-    for i in range(2**k):
-        codeword = np.zeros(n, dtype=int)
-        for j in range(k):
-            if (i >> j) & 1:
-                codeword ^= basis_vectors[j]
-        codewords.append(codeword)
-    
-    return codewords
+from codebook import pack_vectors, generate_codewords, weight_distribution
+from weight_enumerator import gleason_distribution
 
 # Load the basis we found (we'll need to reconstruct it from the output)
 print("=" * 70)
@@ -58,20 +40,19 @@ print(f"\n✓ Reconstructed basis with {len(basis)} vectors")
 
 # Generate all codewords
 print("\nGenerating all codewords...")
-codewords = generate_all_linear_combinations(basis)
+codewords = generate_codewords(pack_vectors(basis))
 print(f"✓ Generated {len(codewords)} codewords")
 
-# Calculate weight distribution
+# Calculate weight distribution (minimum distance comes from the same pass)
 print("\nCalculating weight distribution...")
-weights = [hamming_weight(cw) for cw in codewords]
-weight_dist = Counter(weights)
+distribution, min_dist = weight_distribution(codewords, n)
+weight_dist = {w: int(count) for w, count in enumerate(distribution) if count}
 
 print("\nWeight distribution:")
 for w in sorted(weight_dist.keys()):
     print(f"  Weight {w:2d}: {weight_dist[w]:4d} codewords")
 
-# Find minimum distance (= minimum non-zero weight for linear code)
-min_dist = min(w for w in weights if w > 0)
+# Minimum distance (= minimum non-zero weight for linear code)
 print(f"\n✓ Minimum distance: {min_dist}")
 
 # Check if this matches the expected Golay code weight distribution
@@ -79,13 +60,9 @@ print("\n" + "=" * 70)
 print("COMPARISON WITH KNOWN GOLAY CODE")
 print("=" * 70)
 
-expected_golay_weights = {
-    0: 1,      # all zeros
-    8: 759,    # weight 8
-    12: 2576,  # weight 12
-    16: 759,   # weight 16
-    24: 1,     # all ones
-}
+# Gleason's theorem: a doubly-even self-dual [24,12] code with no
+# weight-4 words has exactly one possible weight distribution
+expected_golay_weights = {w: a for w, a in enumerate(gleason_distribution(24)) if a}
 
 print("\nExpected Extended Binary Golay Code [24,12,8] weight distribution:")
 for w in sorted(expected_golay_weights.keys()):
@@ -0,0 +1,104 @@
+from math import comb
+
+# Weight distributions are lists of exact Python ints, entry w counting
+# the codewords of weight w (length n + 1 for a length-n code).
+
+def krawtchouk(j, x, n):
+    """Krawtchouk polynomial K_j(x) for length n, as an exact integer."""
+    return sum((-1) ** i * comb(x, i) * comb(n - x, j - i) for i in range(j + 1))
+
+def krawtchouk_matrix(n):
+    """K[j][x] = K_j(x) for 0 <= j, x <= n."""
+    return [[krawtchouk(j, x, n) for x in range(n + 1)] for j in range(n + 1)]
+
+def macwilliams(distribution, n):
+    """Weight distribution of the dual code, by the MacWilliams identity.
+
+    B_j = (1 / |C|) * sum over i of A_i K_j(i), computed in exact integer
+    arithmetic.  Raises ValueError if the result is not integral, which
+    means the input cannot be the distribution of a linear code.
+    """
+    distribution = [int(a) for a in distribution] + [0] * (n + 1 - len(distribution))
+    size = sum(distribution)
+    dual = []
+    for row in krawtchouk_matrix(n):
+        total = sum(a * k for a, k in zip(distribution, row))
+        if total % size:
+            raise ValueError("Not the weight distribution of a linear code")
+        dual.append(total // size)
+    return dual
+
+def min_distance_of(distribution):
+    """Smallest nonzero weight with a nonzero count (0 if there is none)."""
+    return next((w for w, a in enumerate(distribution) if w and a), 0)
+
+def is_formally_self_dual(distribution, n):
+    """True when the code and its dual have the same weight distribution."""
+    distribution = [int(a) for a in distribution]
+    return 2 ** (n // 2) == sum(distribution) and macwilliams(distribution, n) == distribution
+
+def _poly_mul(a, b):
+    product = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                product[i + j] += x * y
+    return product
+
+def _poly_pow(a, e):
+    result = [1]
+    for _ in range(e):
+        result = _poly_mul(result, a)
+    return result
+
+# Gleason's invariants in y alone (the x exponent makes each term degree n):
+# g1 = x^8 + 14x^4y^4 + y^8 and g2 = x^4y^4(x^4 - y^4)^4
+_GLEASON_G1 = [1, 0, 0, 0, 14, 0, 0, 0, 1]
+_GLEASON_G2 = [0, 0, 0, 0, 1, 0, 0, 0, -4, 0, 0, 0, 6, 0, 0, 0, -4, 0, 0, 0, 1]
+
+def gleason_distribution(n, low_weight_counts=()):
+    """Weight distribution of a doubly-even self-dual code from its light words.
+
+    Gleason's theorem writes the enumerator as a sum of a_i g1^(n/8 - 3i)
+    g2^i for i <= n/24.  The i-th term starts at y^(4i) with coefficient
+    1, so A_0 = 1 and the counts A_4, A_8, ..., A_(4 floor(n/24)) (given
+    in that order; missing ones are taken as 0) fix every a_i.
+    """
+    if n % 8:
+        raise ValueError("Doubly-even self-dual codes need n divisible by 8")
+    terms = [_poly_mul(_poly_pow(_GLEASON_G1, n // 8 - 3 * i), _poly_pow(_GLEASON_G2, i))
+             for i in range(n // 24 + 1)]
+    targets = [1] + list(low_weight_counts) + [0] * (n // 24 - len(low_weight_counts))
+    if len(targets) > len(terms):
+        raise ValueError(f"Length {n} fixes only A_4..A_{4 * (n // 24)}")
+
+    distribution = [0] * (n + 1)
+    for i, term in enumerate(terms):
+        a = targets[i] - distribution[4 * i]
+        for w, c in enumerate(term):
+            distribution[w] += a * c
+    return distribution
+
+if __name__ == "__main__":
+    from code_cache import load_code
+
+    print("=" * 70)
+    print("WEIGHT ENUMERATORS WITHOUT THE DUAL CODEBOOK")
+    print("=" * 70)
+
+    def show(distribution):
+        return ", ".join(f"A{w}={a:,}" for w, a in enumerate(distribution) if a)
+
+    for filename in ['golay_self_dual_basis.txt', 'golay_perfect_23_basis.txt']:
+        code = load_code(filename)
+        distribution = [int(a) for a in code.weight_distribution]
+        dual = macwilliams(distribution, code.n)
+        print(f"\n{filename} [{code.n},{code.k},{code.min_distance}]:")
+        print(f"  • Code: {show(distribution)}")
+        print(f"  • Dual [{code.n},{code.n - code.k},{min_distance_of(dual)}]: {show(dual)}")
+        print(f"  • Formally self-dual? {is_formally_self_dual(distribution, code.n)}")
+
+    print("\nGleason's theorem for extremal doubly-even self-dual codes:")
+    for n in (24, 48, 72):
+        distribution = gleason_distribution(n)
+        print(f"  • [{n},{n // 2},{min_distance_of(distribution)}]: {show(distribution)}")